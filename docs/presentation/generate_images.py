@@ -1,57 +1,115 @@
 """Generate slide visuals for the presentation deck."""
 
 import argparse
-import json
+import asyncio
+import functools
+import hashlib
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import google.auth
+import orjson
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from PIL import Image
-from tqdm import tqdm
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from tqdm.asyncio import tqdm
 
 MODEL_NAME = "gemini-2.5-flash-image"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 IMAGE_ASPECT_RATIO = "3:4"
 PLACEHOLDER_SIZE = (1152, 1536)
 PROMPTS_FILE = Path(__file__).with_name("prompts.json")
 OUTPUT_DIR = Path(__file__).with_name("assets")
+ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
 
 
 def load_prompts() -> list[dict[str, str]]:
-    with PROMPTS_FILE.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(PROMPTS_FILE.read_bytes())
 
 
 def ensure_output_dir() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def report_pillow_variant() -> None:
+    # Pillow-SIMD is a drop-in fork (versions carry a ".postN" suffix); install it in the
+    # deployment image with `pip uninstall pillow && pip install pillow-simd` for SIMD encode.
+    import PIL
+
+    variant = "Pillow-SIMD" if "post" in PIL.__version__ else "Pillow"
+    print(f"[info] Image pipeline: {variant} {PIL.__version__}")
+
+
 def save_image(part: types.Part, destination: Path) -> None:
     image = part.as_image()
-    image.save(destination)
+    # Deflate level 9 is PIL's default and wastes CPU for slide visuals.
+    image.save(destination, optimize=False, compress_level=1)
+
+
+def cache_key(prompt: str) -> str:
+    payload = orjson.dumps({"model": MODEL_NAME, "prompt": prompt, "aspect": IMAGE_ASPECT_RATIO}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
 
+def cache_file(identifier: str) -> Path:
+    return OUTPUT_DIR / f"{identifier}.png.sha256"
 
+
+def is_cached(identifier: str, key: str) -> bool:
+    sidecar = cache_file(identifier)
+    return (OUTPUT_DIR / f"{identifier}.png").exists() and sidecar.exists() and sidecar.read_text() == key
+
+
+def write_cache_key(identifier: str, key: str) -> None:
+    sidecar = cache_file(identifier)
+    temporary = sidecar.with_name(f"{sidecar.name}.tmp")
+    temporary.write_text(key)
+    os.replace(temporary, sidecar)
+
+
+@functools.lru_cache(maxsize=512)
 def placeholder_color(identifier: str) -> tuple[int, int, int]:
-    seed = sum(ord(char) for char in identifier) % 255
+    seed = sum(identifier.encode()) % 255
     return (50 + seed % 150, 80 + (seed * 3) % 120, 110 + (seed * 5) % 100)
 
 
+@functools.cache
+def placeholder_bytes(color: tuple[int, int, int]) -> bytes:
+    # Solid fills barely compress further at higher deflate levels; encode once per color.
+    buffer = io.BytesIO()
+    Image.new("RGB", PLACEHOLDER_SIZE, color).save(buffer, "PNG", compress_level=1, optimize=False)
+    return buffer.getvalue()
+
+
 def create_placeholder(identifier: str) -> None:
     destination = OUTPUT_DIR / f"{identifier}.png"
-    image = Image.new("RGB", PLACEHOLDER_SIZE, placeholder_color(identifier))
-    image.save(destination)
+    destination.write_bytes(placeholder_bytes(placeholder_color(identifier)))
+
+
+def is_retryable(error: BaseException) -> bool:
+    return isinstance(error, errors.APIError) and error.code in RETRYABLE_STATUS_CODES
 
 
-def generate_image(client: genai.Client, identifier: str, prompt: str) -> None:
-    response = client.models.generate_content(
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception(is_retryable),
+    reraise=True,
+)
+async def generate_image(client: genai.Client, identifier: str, prompt: str) -> None:
+    response = await client.aio.models.generate_content(
         model=MODEL_NAME,
         contents=[prompt],
         config=types.GenerateContentConfig(image_config=types.ImageConfig(aspect_ratio=IMAGE_ASPECT_RATIO)),
     )
     for part in response.parts:
         if part.inline_data is not None:
-            save_image(part, OUTPUT_DIR / f"{identifier}.png")
+            # PNG encode is CPU-bound; keep it off the event loop so other requests stay in flight.
+            await asyncio.get_running_loop().run_in_executor(ENCODE_POOL, save_image, part, OUTPUT_DIR / f"{identifier}.png")
+            write_cache_key(identifier, cache_key(prompt))
             return
     print(f"[warn] No image payload in response for {identifier}; creating placeholder")
     create_placeholder(identifier)
@@ -73,6 +131,24 @@ def build_client() -> genai.Client:
     )
 
 
+async def generate_all(client: genai.Client, prompts: list[dict[str, str]], force: bool = False) -> None:
+    semaphore = asyncio.Semaphore(int(os.getenv("GEN_CONCURRENCY", "8")))
+
+    async def bounded(entry: dict[str, str]) -> None:
+        identifier = entry["id"]
+        if not force and is_cached(identifier, cache_key(entry["prompt"])):
+            return
+        async with semaphore:
+            try:
+                await generate_image(client, identifier, entry["prompt"])
+            except Exception as error:  # pragma: no cover
+                print(f"[warn] {identifier}: {error}; creating placeholder image.")
+                create_placeholder(identifier)
+
+    for task in tqdm.as_completed([bounded(entry) for entry in prompts]):
+        await task
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate slide visuals for the presentation.")
     parser.add_argument(
@@ -80,6 +156,11 @@ def parse_args() -> argparse.Namespace:
         nargs="*",
         help="Specific image IDs to generate (e.g., s08_prompts s12_lessons). If omitted, generates all.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate images even when the cached prompt hash is unchanged.",
+    )
     return parser.parse_args()
 
 
@@ -87,23 +168,18 @@ def main() -> None:
     args = parse_args()
     client = build_client()
     ensure_output_dir()
+    report_pillow_variant()
 
-    prompts = load_prompts()
+    all_prompts = load_prompts()
+    prompts = all_prompts
     if args.ids:
         filter_set = set(args.ids)
-        prompts = [p for p in prompts if p["id"] in filter_set]
+        prompts = [p for p in all_prompts if p["id"] in filter_set]
         if not prompts:
-            print(f"[error] No matching IDs found. Available: {[p['id'] for p in load_prompts()]}")
+            print(f"[error] No matching IDs found. Available: {[p['id'] for p in all_prompts]}")
             return
 
-    for entry in tqdm(prompts):
-        identifier = entry["id"]
-        prompt = entry["prompt"]
-        try:
-            generate_image(client, identifier, prompt)
-        except Exception as error:  # pragma: no cover
-            print(f"[warn] {identifier}: {error}; creating placeholder image.")
-            create_placeholder(identifier)
+    asyncio.run(generate_all(client, prompts, force=args.force))
 
 
 if __name__ == "__main__":
@@ -9,11 +9,41 @@ Example:
 """
 
 import argparse
-import json
+import mmap
+import os
 import sys
-from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
+import ijson
+import numpy as np
+import orjson
+
+METRICS = ("relevance", "helpfulness", "conciseness", "structure", "tone", "error_handling", "tool_appropriateness")
+GET_METRICS = itemgetter(*METRICS)
+AMBIGUOUS_IDS = frozenset({"q_036", "q_037", "q_038", "q_039"})
+# Questions to investigate
+PROBLEMATIC_IDS = frozenset({"q_005", "q_012", "q_013", "q_033", "q_036", "q_037", "q_038"})
+
+
+def metric_scores(scores: dict) -> tuple:
+    """Extract the score of every metric in METRICS order with one C-level lookup."""
+    return GET_METRICS({m: (scores.get(m) or {}).get("score") for m in METRICS})
+
+
+def response_preview(record: dict) -> str:
+    """Coerce final_response to a short preview string once per record."""
+    resp = record.get("final_response")
+    if isinstance(resp, list):
+        return (resp[0].get("text", "") if resp else "")[:300]
+    return str(resp)[:300]
+
+
+def score_row(values: tuple) -> np.ndarray:
+    """Pack one record's metric values into a fixed-width row (NaN = missing)."""
+    return np.array([np.nan if value is None else value for value in values])
+
 
 def get_available_evaluation_files() -> list[Path]:
     """Return list of evaluation JSON files in the results directory."""
@@ -23,205 +53,251 @@ def get_available_evaluation_files() -> list[Path]:
     return sorted(results_dir.glob("evaluation_*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
 
 
-def load_data(eval_file: Path) -> dict:
-    if not eval_file.exists():
-        print(f"Error: Evaluation file not found: {eval_file}", file=sys.stderr)
-        available = get_available_evaluation_files()
-        if available:
-            print("\nAvailable evaluation files:", file=sys.stderr)
-            for f in available:
-                print(f"  - {f.name}", file=sys.stderr)
-        sys.exit(1)
+def check_eval_file(eval_file: Path) -> None:
+    """Exit with a listing of available files if the evaluation file is missing."""
+    if eval_file.exists():
+        return
+    print(f"Error: Evaluation file not found: {eval_file}", file=sys.stderr)
+    available = get_available_evaluation_files()
+    if available:
+        print("\nAvailable evaluation files:", file=sys.stderr)
+        for f in available:
+            print(f"  - {f.name}", file=sys.stderr)
+    sys.exit(1)
+
+
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+def open_for_parse(eval_file: Path):
+    """Return a parse buffer; large files are mmapped for zero-copy page-cache reads."""
+    f = open(eval_file, "rb")
+    if os.path.getsize(eval_file) <= MMAP_THRESHOLD:
+        return f
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
+        f.close()
+
+
+def load_summary(eval_file: Path) -> dict:
+    """Parse only the summary object without materializing the results array."""
+    with open_for_parse(eval_file) as buf:
+        return next(ijson.items(buf, "summary", use_float=True), {})
+
+
+def iter_results(eval_file: Path):
+    """Stream result records one at a time instead of loading the whole file."""
+    with open_for_parse(eval_file) as buf:
+        yield from ijson.items(buf, "results.item", use_float=True)
+
+
+@dataclass(slots=True)
+class ErrorHandlingHit:
+    question_id: str
+    question: str
+    score: float
+    reason: str
+
+
+@dataclass(slots=True)
+class RelHelpHit:
+    question_id: str
+    question: str
+    relevance: float
+    helpfulness: float
+    tone: float
+    structure: float
+    response: str
+
 
-    with open(eval_file) as f:
-        return json.load(f)
+@dataclass(slots=True)
+class VarianceRecord:
+    question_id: str
+    question: str
+    scores: dict
+    variance: float = 0.0
 
 
-def analyze_error_handling_issues(data):
+class ErrorHandlingAnalyzer:
     """Find cases where error_handling scored low (0.1) for factual responses."""
-    print("\n" + "=" * 80)
-    print("POTENTIAL ERROR_HANDLING METRIC ISSUES")
-    print("=" * 80)
 
-    low_error_handling = []
-    for r in data["results"]:
-        eh = r["scores"].get("error_handling", {})
+    def __init__(self):
+        self.flagged = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        eh = scores.get("error_handling", {})
         score = eh.get("score")
         reason = eh.get("reason", "")
 
         if score is not None and score <= 0.15:
             # Check if reason mentions "factual" or "no error handling needed"
             if "factual" in reason.lower() or "no error" in reason.lower():
-                low_error_handling.append(
-                    {
-                        "question_id": r["question_id"],
-                        "question": r["question"],
-                        "score": score,
-                        "reason": reason[:200],
-                    }
-                )
-
-    print(f"\nFound {len(low_error_handling)} cases where error_handling scored ≤0.15 despite factual response:")
-    for item in low_error_handling[:10]:
-        print(f"\n  {item['question_id']}: {item['question'][:60]}...")
-        print(f"    Score: {item['score']}")
-        print(f"    Reason: {item['reason'][:150]}...")
-
-
-def analyze_ambiguous_query_handling(data):
+                self.flagged.append(ErrorHandlingHit(qid, r["question"], score, reason[:200]))
+
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("POTENTIAL ERROR_HANDLING METRIC ISSUES")
+        print("=" * 80)
+
+        print(f"\nFound {len(self.flagged)} cases where error_handling scored ≤0.15 despite factual response:")
+        for item in self.flagged[:10]:
+            print(f"\n  {item.question_id}: {item.question[:60]}...")
+            print(f"    Score: {item.score}")
+            print(f"    Reason: {item.reason[:150]}...")
+
+
+class AmbiguousQueryAnalyzer:
     """Find cases where ambiguous queries were penalized for appropriate clarification."""
-    print("\n" + "=" * 80)
-    print("AMBIGUOUS QUERY HANDLING ANALYSIS")
-    print("=" * 80)
 
-    ambiguous_ids = ["q_036", "q_037", "q_038", "q_039"]
+    def __init__(self):
+        self.matched = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        if qid in AMBIGUOUS_IDS:
+            self.matched.append((r, preview))
 
-    for r in data["results"]:
-        if r["question_id"] in ambiguous_ids:
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("AMBIGUOUS QUERY HANDLING ANALYSIS")
+        print("=" * 80)
+
+        for r, preview in self.matched:
             print(f"\n{r['question_id']}: '{r['question']}'")
-            print(f"  Response preview: {str(r.get('final_response'))[:150]}...")
+            print(f"  Response preview: {preview[:150]}...")
             print("  Scores:")
             for metric, val in r["scores"].items():
-                if val.get("score") is not None:
-                    print(f"    {metric}: {val['score']:.2f} - {val.get('reason', '')[:80]}...")
+                score = val.get("score")
+                if score is not None:
+                    print(f"    {metric}: {score:.2f} - {val.get('reason', '')[:80]}...")
 
 
-def analyze_relevance_helpfulness_discrepancies(data):
+class RelevanceHelpfulnessAnalyzer:
     """Find cases with very low relevance/helpfulness but potentially good responses."""
-    print("\n" + "=" * 80)
-    print("LOW RELEVANCE/HELPFULNESS ANALYSIS")
-    print("=" * 80)
 
-    issues = []
-    for r in data["results"]:
-        rel = r["scores"].get("relevance", {}).get("score")
-        help_score = r["scores"].get("helpfulness", {}).get("score")
-        tone = r["scores"].get("tone", {}).get("score")
-        structure = r["scores"].get("structure", {}).get("score")
+    def __init__(self):
+        self.issues = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        rel, help_score, _conciseness, structure, tone, _error_handling, _tool = values
 
         # If tone and structure are high but relevance/helpfulness are very low - potential issue
         if rel is not None and help_score is not None and tone is not None and structure is not None:
             if (rel < 0.1 or help_score < 0.1) and tone > 0.7 and structure > 0.6:
-                issues.append(
-                    {
-                        "question_id": r["question_id"],
-                        "question": r["question"],
-                        "relevance": rel,
-                        "helpfulness": help_score,
-                        "tone": tone,
-                        "structure": structure,
-                        "response": str(r.get("final_response"))[:200],
-                    }
-                )
-
-    print(f"\nFound {len(issues)} cases with low rel/help but high tone/structure:")
-    for item in issues:
-        print(f"\n  {item['question_id']}: {item['question'][:50]}...")
-        print(f"    relevance={item['relevance']:.2f}, helpfulness={item['helpfulness']:.2f}")
-        print(f"    tone={item['tone']:.2f}, structure={item['structure']:.2f}")
-        print(f"    Response: {item['response'][:150]}...")
-
-
-def analyze_by_category(data):
+                self.issues.append(RelHelpHit(qid, r["question"], rel, help_score, tone, structure, preview[:200]))
+
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("LOW RELEVANCE/HELPFULNESS ANALYSIS")
+        print("=" * 80)
+
+        print(f"\nFound {len(self.issues)} cases with low rel/help but high tone/structure:")
+        for item in self.issues:
+            print(f"\n  {item.question_id}: {item.question[:50]}...")
+            print(f"    relevance={item.relevance:.2f}, helpfulness={item.helpfulness:.2f}")
+            print(f"    tone={item.tone:.2f}, structure={item.structure:.2f}")
+            print(f"    Response: {item.response[:150]}...")
+
+
+class CategoryAnalyzer:
     """Analyze scores grouped by category."""
-    print("\n" + "=" * 80)
-    print("ANALYSIS BY CATEGORY")
-    print("=" * 80)
 
-    # Load questions to get categories
-    questions_file = Path(__file__).parent / "dataset" / "questions.json"
-    with open(questions_file) as f:
-        questions = {q["id"]: q for q in json.load(f)}
-
-    categories = defaultdict(lambda: defaultdict(list))
-
-    for r in data["results"]:
-        qid = r["question_id"]
-        category = questions.get(qid, {}).get("category", "unknown")
-
-        for metric, val in r["scores"].items():
-            if val.get("score") is not None:
-                categories[category][metric].append(val["score"])
-
-    print("\nAverage scores by category and metric:\n")
-    header = f"{'Category':<15}"
-    metrics = ["relevance", "helpfulness", "conciseness", "structure", "tone", "error_handling", "tool_appropriateness"]
-    for m in metrics:
-        header += f"{m[:8]:<10}"
-    print(header)
-    print("-" * len(header))
-
-    for category in sorted(categories.keys()):
-        row = f"{category:<15}"
-        for m in metrics:
-            scores = categories[category].get(m, [])
-            if scores:
-                avg = sum(scores) / len(scores)
-                row += f"{avg:.2f}      "
-            else:
-                row += "N/A       "
-        print(row)
-
-
-def analyze_score_inconsistencies(data):
+    def __init__(self, question_categories: dict[str, str]):
+        self.question_categories = question_categories
+        self.rows = []
+        self.record_categories = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        self.rows.append(score_row(values))
+        self.record_categories.append(self.question_categories.get(qid, "unknown"))
+
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("ANALYSIS BY CATEGORY")
+        print("=" * 80)
+
+        print("\nAverage scores by category and metric:\n")
+        header = f"{'Category':<15}"
+        for m in METRICS:
+            header += f"{m[:8]:<10}"
+        print(header)
+        print("-" * len(header))
+
+        mat = np.vstack(self.rows) if self.rows else np.empty((0, len(METRICS)))
+        cats = np.array(self.record_categories)
+        for category in sorted(set(self.record_categories)):
+            block = mat[cats == category]
+            counts = np.sum(~np.isnan(block), axis=0)
+            sums = np.nansum(block, axis=0)
+            row = f"{category:<15}"
+            for index in range(len(METRICS)):
+                if counts[index]:
+                    row += f"{sums[index] / counts[index]:.2f}      "
+                else:
+                    row += "N/A       "
+            print(row)
+
+
+class ScoreVarianceAnalyzer:
     """Find responses with very inconsistent scores across metrics."""
-    print("\n" + "=" * 80)
-    print("SCORE INCONSISTENCIES (high variance)")
-    print("=" * 80)
-
-    inconsistent = []
-    for r in data["results"]:
-        scores = []
-        for _metric, val in r["scores"].items():
-            if val.get("score") is not None:
-                scores.append(val["score"])
-
-        if len(scores) >= 4:
-            avg = sum(scores) / len(scores)
-            variance = sum((s - avg) ** 2 for s in scores) / len(scores)
-
-            # High variance suggests inconsistent grading
-            if variance > 0.15:  # threshold
-                inconsistent.append(
-                    {
-                        "question_id": r["question_id"],
-                        "question": r["question"][:50],
-                        "variance": variance,
-                        "scores": {m: v.get("score") for m, v in r["scores"].items() if v.get("score") is not None},
-                    }
-                )
-
-    inconsistent.sort(key=lambda x: x["variance"], reverse=True)
-
-    print("\nTop 10 responses with highest score variance:")
-    for item in inconsistent[:10]:
-        print(f"\n  {item['question_id']}: {item['question']}...")
-        print(f"    Variance: {item['variance']:.3f}")
-        for m, s in item["scores"].items():
-            print(f"      {m}: {s:.2f}")
-
-
-def analyze_specific_questions(data):
+
+    def __init__(self):
+        self.rows = []
+        self.records = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        self.rows.append(score_row(values))
+        self.records.append(VarianceRecord(qid, r["question"][:50], {m: s for m, v in scores.items() if (s := v.get("score")) is not None}))
+
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("SCORE INCONSISTENCIES (high variance)")
+        print("=" * 80)
+
+        mat = np.vstack(self.rows) if self.rows else np.empty((0, len(METRICS)))
+        present = ~np.isnan(mat)
+        counts = present.sum(axis=1)
+        sums = np.nansum(mat, axis=1)
+        means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        variances = np.nansum((mat - means[:, None]) ** 2, axis=1) / np.maximum(counts, 1)
+
+        # High variance suggests inconsistent grading
+        inconsistent = []
+        for index in np.flatnonzero((counts >= 4) & (variances > 0.15)):  # threshold
+            record = self.records[index]
+            record.variance = float(variances[index])
+            inconsistent.append(record)
+        inconsistent.sort(key=attrgetter("variance"), reverse=True)
+
+        print("\nTop 10 responses with highest score variance:")
+        for item in inconsistent[:10]:
+            print(f"\n  {item.question_id}: {item.question}...")
+            print(f"    Variance: {item.variance:.3f}")
+            for m, s in item.scores.items():
+                print(f"      {m}: {s:.2f}")
+
+
+class DeepDiveAnalyzer:
     """Deep dive into specific questions that look problematic."""
-    print("\n" + "=" * 80)
-    print("SPECIFIC QUESTION DEEP DIVE")
-    print("=" * 80)
 
-    # Questions to investigate
-    problematic_ids = ["q_005", "q_012", "q_013", "q_033", "q_036", "q_037", "q_038"]
+    def __init__(self):
+        self.matched = []
+
+    def ingest(self, qid: str, scores: dict, values: tuple, preview: str, r: dict) -> None:
+        if qid in PROBLEMATIC_IDS:
+            self.matched.append((r, preview))
+
+    def report(self) -> None:
+        print("\n" + "=" * 80)
+        print("SPECIFIC QUESTION DEEP DIVE")
+        print("=" * 80)
 
-    for r in data["results"]:
-        if r["question_id"] in problematic_ids:
+        for r, preview in self.matched:
             print(f"\n{'=' * 60}")
             print(f"Question ID: {r['question_id']}")
             print(f"Question: {r['question']}")
             print("\nResponse preview:")
-            resp = r.get("final_response")
-            if isinstance(resp, list):
-                resp_text = resp[0].get("text", "") if resp else ""
-            else:
-                resp_text = str(resp)
-            print(f"  {resp_text[:300]}...")
+            print(f"  {preview}...")
 
             print("\nScores:")
             for metric, val in r["scores"].items():
@@ -231,6 +307,12 @@ def analyze_specific_questions(data):
                 print(f"    Reason: {reason}...")
 
 
+def load_question_categories() -> dict[str, str]:
+    """Load questions once and flatten them into an id -> category lookup."""
+    questions_file = Path(__file__).parent / "dataset" / "questions.json"
+    return {q["id"]: q.get("category", "unknown") for q in orjson.loads(questions_file.read_bytes())}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Analyze evaluation results and find potential grading issues.")
     parser.add_argument(
@@ -243,17 +325,36 @@ def main():
     eval_file = args.evaluation_file
     if not eval_file.is_absolute():
         eval_file = Path(__file__).parent / eval_file
-
-    data = load_data(eval_file)
-    print(f"Loaded {len(data['results'])} evaluation results from {args.evaluation_file}")
-    print(f"Summary scores: {data['summary']['avg_scores']}")
-
-    analyze_error_handling_issues(data)
-    analyze_ambiguous_query_handling(data)
-    analyze_relevance_helpfulness_discrepancies(data)
-    analyze_by_category(data)
-    analyze_score_inconsistencies(data)
-    analyze_specific_questions(data)
+    check_eval_file(eval_file)
+
+    summary = load_summary(eval_file)
+
+    analyzers = [
+        ErrorHandlingAnalyzer(),
+        AmbiguousQueryAnalyzer(),
+        RelevanceHelpfulnessAnalyzer(),
+        CategoryAnalyzer(load_question_categories()),
+        ScoreVarianceAnalyzer(),
+        DeepDiveAnalyzer(),
+    ]
+
+    # Hoist bound methods so the hot loop only does LOAD_FAST lookups.
+    ingests = [analyzer.ingest for analyzer in analyzers]
+    count = 0
+    for record in iter_results(eval_file):
+        count += 1
+        qid = record["question_id"]
+        scores = record["scores"]
+        values = metric_scores(scores)
+        preview = response_preview(record)
+        for ingest in ingests:
+            ingest(qid, scores, values, preview, record)
+
+    print(f"Loaded {count} evaluation results from {args.evaluation_file}")
+    print(f"Summary scores: {summary.get('avg_scores')}")
+
+    for analyzer in analyzers:
+        analyzer.report()
 
 
 if __name__ == "__main__":
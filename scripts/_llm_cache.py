@@ -0,0 +1,34 @@
+"""Content-addressed on-disk cache for deterministic LLM calls in the evaluation scripts."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".llm_cache"
+
+
+class LLMCache:
+    """File-per-entry cache keyed by SHA-256 of a canonicalized request payload."""
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR):
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, payload: dict[str, Any]) -> Path:
+        key = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+        return self._dir / f"{key}.json"
+
+    def get(self, payload: dict[str, Any]) -> Any | None:
+        path = self._path(payload)
+        if not path.exists():
+            return None
+        return orjson.loads(path.read_bytes())
+
+    def set(self, payload: dict[str, Any], value: Any) -> None:
+        path = self._path(payload)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(orjson.dumps(value, default=str))
+        os.replace(temporary, path)
@@ -1,16 +1,21 @@
 """Temporary script to explore FIB API and fetch sample data for evaluation dataset creation."""
 
-import json
+import argparse
+import asyncio
 import os
 from pathlib import Path
 
-import requests
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 
 load_dotenv()
 
 BASE_URL = "https://api.fib.upc.edu/v2"
 CLIENT_ID = os.environ.get("FIB_CLIENT_ID")
+PAGE_CONCURRENCY = 16
+LIMITER = AsyncLimiter(max_rate=5, time_period=1)  # 5 req/s client-side budget
 
 ENDPOINTS = [
     {"name": "assignatures", "path": "assignatures", "description": "Course/subject catalog"},
@@ -22,36 +27,128 @@ ENDPOINTS = [
 ]
 
 
-def fetch_endpoint(path: str, params: dict | None = None) -> dict | list:
-    """Fetch data from FIB API endpoint."""
+def build_client() -> httpx.AsyncClient:
+    """Build an HTTP/2 client so concurrent page fetches multiplex over one connection."""
     headers = {
         "client_id": CLIENT_ID,
         "Accept": "application/json",
         "Accept-Language": "en",
     }
-    url = f"{BASE_URL}/{path}"
-    response = requests.get(url, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    return httpx.AsyncClient(http2=True, headers=headers, timeout=30)
 
 
-def fetch_all_paginated(path: str) -> list:
-    """Fetch all pages of a paginated endpoint."""
-    all_results = []
-    page = 1
+async def fetch_endpoint(client: httpx.AsyncClient, path: str, params: dict | None = None) -> dict | list:
+    """Fetch data from FIB API endpoint, throttled by the shared token bucket."""
     while True:
-        data = fetch_endpoint(path, {"page": page})
-        if isinstance(data, dict) and "results" in data:
-            all_results.extend(data["results"])
+        async with LIMITER:
+            response = await client.get(f"{BASE_URL}/{path}", params=params)
+        if response.status_code == 429:
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+            continue
+        response.raise_for_status()
+        return response.json()
+
+
+async def iter_paginated(client: httpx.AsyncClient, path: str, semaphore: asyncio.Semaphore):
+    """Yield records of a paginated endpoint page-by-page, remaining pages concurrently."""
+
+    async def fetch_page(page: int) -> dict | list:
+        async with semaphore:
+            return await fetch_endpoint(client, path, {"page": page})
+
+    first = await fetch_page(1)
+    if not (isinstance(first, dict) and "results" in first):
+        for record in first if isinstance(first, list) else [first]:
+            yield record
+        return
+
+    for record in first["results"]:
+        yield record
+    if not first.get("next"):
+        return
+
+    count = first.get("count")
+    page_size = len(first["results"])
+    if count and page_size:
+        # Total is known: issue the remaining pages concurrently and drain them as they land.
+        last_page = -(-count // page_size)
+        for result in asyncio.as_completed([fetch_page(page) for page in range(2, last_page + 1)]):
+            data = await result
+            for record in data.get("results", []):
+                yield record
+    else:
+        # No count reported: fall back to walking the next links serially.
+        page = 2
+        while True:
+            data = await fetch_page(page)
+            for record in data["results"]:
+                yield record
             if not data.get("next"):
                 break
             page += 1
-        else:
-            return data if isinstance(data, list) else [data]
-    return all_results
+
+
+async def dump_endpoint(client: httpx.AsyncClient, path: str, output_file: Path, semaphore: asyncio.Semaphore, pretty_json: bool) -> int:
+    """Stream an endpoint to NDJSON (or a pretty JSON array) and return the record count."""
+    if pretty_json:
+        records = [record async for record in iter_paginated(client, path, semaphore)]
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        return len(records)
+
+    written = 0
+    with open(output_file, "wb") as f:
+        async for record in iter_paginated(client, path, semaphore):
+            f.write(orjson.dumps(record) + b"\n")
+            written += 1
+    return written
+
+
+async def fetch_all_endpoints(output_dir: Path, pretty_json: bool) -> None:
+    """Fetch every endpoint concurrently and dump each to its own file."""
+    suffix = "json" if pretty_json else "ndjson"
+    async with build_client() as client:
+        semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+        tasks = {}
+        for endpoint in ENDPOINTS:
+            output_file = output_dir / f"{endpoint['name']}.{suffix}"
+            tasks[endpoint["name"]] = (asyncio.create_task(dump_endpoint(client, endpoint["path"], output_file, semaphore, pretty_json)), output_file)
+        for endpoint in ENDPOINTS:
+            name = endpoint["name"]
+            print(f"\nFetching {name}...")
+
+            try:
+                task, output_file = tasks[name]
+                written = await task
+                print(f"  ✅ Saved {written} records to {output_file}")
+            except Exception as e:
+                print(f"  ❌ Error: {e}")
+
+
+def load_records(output_dir: Path, name: str) -> list | None:
+    """Load a dumped endpoint from NDJSON or the legacy JSON array format."""
+    ndjson_file = output_dir / f"{name}.ndjson"
+    if ndjson_file.exists():
+        with open(ndjson_file, "rb") as f:
+            return [orjson.loads(line) for line in f]
+    json_file = output_dir / f"{name}.json"
+    if json_file.exists():
+        return orjson.loads(json_file.read_bytes())
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Explore FIB API endpoints and dump sample data.")
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Write indented JSON arrays instead of streaming NDJSON.",
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
     if not CLIENT_ID:
         print("Error: FIB_CLIENT_ID not found in environment variables")
         return
@@ -62,19 +159,7 @@ def main():
     print(f"Using Client ID: {CLIENT_ID[:20]}...")
     print("=" * 70)
 
-    for endpoint in ENDPOINTS:
-        name = endpoint["name"]
-        path = endpoint["path"]
-        print(f"\nFetching {name}...")
-
-        try:
-            data = fetch_all_paginated(path)
-            output_file = output_dir / f"{name}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"  ✅ Saved {len(data)} records to {output_file}")
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+    asyncio.run(fetch_all_endpoints(output_dir, args.pretty_json))
 
     print("\n" + "=" * 70)
     print("Exploration complete!")
@@ -83,26 +168,20 @@ def main():
     print("\n\nSample data summary:")
     print("-" * 70)
 
-    courses_file = output_dir / "assignatures.json"
-    if courses_file.exists():
-        with open(courses_file) as f:
-            courses = json.load(f)
+    courses = load_records(output_dir, "assignatures")
+    if courses:
         print(f"\nCourses ({len(courses)} total):")
         for course in courses[:5]:
             print(f"  - {course['id']}: {course['nom']} ({course['credits']} credits)")
 
-    professors_file = output_dir / "professors.json"
-    if professors_file.exists():
-        with open(professors_file) as f:
-            professors = json.load(f)
+    professors = load_records(output_dir, "professors")
+    if professors:
         print(f"\nProfessors ({len(professors)} total):")
         for prof in professors[:5]:
             print(f"  - {prof['nom']} {prof['cognoms']} ({prof['departament']})")
 
-    examens_file = output_dir / "examens.json"
-    if examens_file.exists():
-        with open(examens_file) as f:
-            examens = json.load(f)
+    examens = load_records(output_dir, "examens")
+    if examens:
         print(f"\nExams ({len(examens)} total):")
         for exam in examens[:5]:
             print(f"  - {exam['assig']}: {exam['inici']} in {exam['aules']}")
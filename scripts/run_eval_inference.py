@@ -6,21 +6,38 @@ the final response along with trajectory data (tool calls and results).
 """
 
 import argparse
+import asyncio
 import importlib
-import json
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from difflib import SequenceMatcher
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import ijson
+import orjson
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from tenacity import AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
 
-from src.agent.main import GEMINI_MODELS, CustomModelStrategy, create_fib_agent
+from scripts._llm_cache import DEFAULT_CACHE_DIR, LLMCache
+from src.agent.main import GEMINI_MODELS, CustomModelStrategy, create_fib_agent, create_model_strategy
 
 QUESTIONS_PATH = Path(__file__).parent.parent / "evaluation" / "dataset" / "questions.json"
 RESULTS_DIR = Path(__file__).parent.parent / "evaluation" / "results"
 
+RETRYABLE_EXCEPTION_NAMES = frozenset({"ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError", "DeadlineExceeded"})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Treat rate limits, transient server errors and timeouts as retryable."""
+    return (
+        isinstance(error, TimeoutError) or type(error).__name__ in RETRYABLE_EXCEPTION_NAMES or getattr(error, "code", None) in RETRYABLE_STATUS_CODES
+    )
+
 
 def extract_model_name(model_info: dict[str, Any]) -> str:
     """Extract a clean model name from model info dict."""
@@ -52,39 +69,61 @@ def load_custom_model(class_path: str, model_kwargs: dict[str, Any]) -> BaseChat
     return model_class(**model_kwargs)
 
 
-def load_questions(path: Path = QUESTIONS_PATH) -> list[dict[str, Any]]:
-    """Load questions from the evaluation dataset."""
-    with open(path) as f:
-        return json.load(f)
+def load_questions(path: Path = QUESTIONS_PATH) -> Iterator[dict[str, Any]]:
+    """Stream questions from the evaluation dataset one at a time."""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
 
 
 def filter_questions(
-    questions: list[dict[str, Any]],
+    questions: Iterable[dict[str, Any]],
     question_id: str | None = None,
-    category: str | None = None,
-    complexity: str | None = None,
+    categories: Iterable[str] | None = None,
+    complexities: Iterable[str] | None = None,
     skip_auth: bool = False,
-) -> list[dict[str, Any]]:
-    """Filter questions based on criteria."""
-    filtered = questions
-
-    if question_id:
-        filtered = [q for q in filtered if q["id"] == question_id]
+    completed_ids: frozenset[str] = frozenset(),
+) -> Iterator[dict[str, Any]]:
+    """Filter questions lazily with one predicate per record instead of a pass per criterion."""
+    cats = frozenset(categories) if categories else None
+    comps = frozenset(complexities) if complexities else None
 
-    if category:
-        filtered = [q for q in filtered if q["category"] == category]
+    def predicate(q: dict[str, Any]) -> bool:
+        return (
+            (question_id is None or q["id"] == question_id)
+            and (cats is None or q["category"] in cats)
+            and (comps is None or q["complexity"] in comps)
+            and (not skip_auth or not q.get("requires_auth", False))
+            and q["id"] not in completed_ids
+        )
 
-    if complexity:
-        filtered = [q for q in filtered if q["complexity"] == complexity]
+    return filter(predicate, questions)
 
-    if skip_auth:
-        filtered = [q for q in filtered if not q.get("requires_auth", False)]
 
-    return filtered
+def dedup_questions(
+    questions: list[dict[str, Any]],
+    threshold: float,
+) -> tuple[list[dict[str, Any]], list[tuple[dict[str, Any], str]]]:
+    """Split questions into unique representatives and near-duplicates above the similarity threshold."""
+    unique: list[dict[str, Any]] = []
+    duplicates: list[tuple[dict[str, Any], str]] = []
+    for question in questions:
+        text = question["question"].lower()
+        representative = next((rep for rep in unique if SequenceMatcher(None, text, rep["question"].lower()).ratio() >= threshold), None)
+        if representative is None:
+            unique.append(question)
+        else:
+            duplicates.append((question, representative["id"]))
+    return unique, duplicates
 
 
 def extract_text_from_content(content: Any) -> str:
     """Extract text from AIMessage content which may be a string or list of content blocks."""
+    if type(content) is str:
+        return content
+    return _extract_text_slow(content)
+
+
+def _extract_text_slow(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
@@ -98,32 +137,44 @@ def extract_text_from_content(content: Any) -> str:
     return str(content)
 
 
+def _extract_human(msg: HumanMessage) -> dict[str, Any]:
+    return {
+        "type": "human",
+        "content": msg.content,
+    }
+
+
+def _extract_ai(msg: AIMessage) -> dict[str, Any]:
+    result = {
+        "type": "ai",
+        "content": extract_text_from_content(msg.content),
+    }
+    if msg.tool_calls:
+        result["tool_calls"] = [{"name": tc["name"], "args": tc["args"]} for tc in msg.tool_calls]
+    return result
+
+
+def _extract_tool(msg: ToolMessage) -> dict[str, Any]:
+    return {
+        "type": "tool",
+        "name": msg.name,
+        "content": msg.content,
+    }
+
+
+def _extract_default(msg: Any) -> dict[str, Any]:
+    return {
+        "type": msg.__class__.__name__.lower(),
+        "content": str(msg.content) if hasattr(msg, "content") else str(msg),
+    }
+
+
+EXTRACTORS = {HumanMessage: _extract_human, AIMessage: _extract_ai, ToolMessage: _extract_tool}
+
+
 def extract_message(msg: Any) -> dict[str, Any]:
-    """Extract relevant fields from a LangChain message."""
-    if isinstance(msg, HumanMessage):
-        return {
-            "type": "human",
-            "content": msg.content,
-        }
-    elif isinstance(msg, AIMessage):
-        result = {
-            "type": "ai",
-            "content": extract_text_from_content(msg.content),
-        }
-        if msg.tool_calls:
-            result["tool_calls"] = [{"name": tc["name"], "args": tc["args"]} for tc in msg.tool_calls]
-        return result
-    elif isinstance(msg, ToolMessage):
-        return {
-            "type": "tool",
-            "name": msg.name,
-            "content": msg.content,
-        }
-    else:
-        return {
-            "type": msg.__class__.__name__.lower(),
-            "content": str(msg.content) if hasattr(msg, "content") else str(msg),
-        }
+    """Extract relevant fields from a LangChain message with one dict lookup on its type."""
+    return EXTRACTORS.get(type(msg), _extract_default)(msg)
 
 
 def extract_trajectory(messages: list[Any]) -> list[dict[str, Any]]:
@@ -139,90 +190,130 @@ def get_final_response(messages: list[Any]) -> str:
     return ""
 
 
-def run_inference(question: dict[str, Any], agent: Any, model_info: dict[str, Any]) -> dict[str, Any]:
-    """Run agent inference on a single question."""
-    question_text = question["question"]
+def build_result(
+    question: dict[str, Any],
+    model_info: dict[str, Any],
+    final_response: str | None = None,
+    trajectory: list[dict[str, Any]] | None = None,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build a result record for a question."""
+    return {
+        "question_id": question["id"],
+        "question": question["question"],
+        "final_response": final_response,
+        "trajectory": trajectory or [],
+        "metadata": {
+            "category": question.get("category"),
+            "complexity": question.get("complexity"),
+            "expected_tools": question.get("expected_tools", []),
+            "requires_auth": question.get("requires_auth", False),
+            "model": model_info,
+        },
+        "error": error,
+    }
 
-    try:
-        result = agent.invoke({"messages": [{"role": "user", "content": question_text}]})
 
+def run_inference(question: dict[str, Any], agent: Any, model_info: dict[str, Any], max_retries: int = 5) -> dict[str, Any]:
+    """Run agent inference on a single question synchronously."""
+    try:
+        for attempt in Retrying(
+            stop=stop_after_attempt(max_retries), wait=wait_random_exponential(min=1, max=30), retry=retry_if_exception(is_retryable), reraise=True
+        ):
+            with attempt:
+                result = agent.invoke({"messages": [{"role": "user", "content": question["question"]}]})
         messages = result.get("messages", [])
-        trajectory = extract_trajectory(messages)
-        final_response = get_final_response(messages)
-
-        return {
-            "question_id": question["id"],
-            "question": question_text,
-            "final_response": final_response,
-            "trajectory": trajectory,
-            "metadata": {
-                "category": question.get("category"),
-                "complexity": question.get("complexity"),
-                "expected_tools": question.get("expected_tools", []),
-                "requires_auth": question.get("requires_auth", False),
-                "model": model_info,
-            },
-            "error": None,
-        }
+        return build_result(question, model_info, final_response=get_final_response(messages), trajectory=extract_trajectory(messages))
     except Exception as e:
-        return {
-            "question_id": question["id"],
-            "question": question_text,
-            "final_response": None,
-            "trajectory": [],
-            "metadata": {
-                "category": question.get("category"),
-                "complexity": question.get("complexity"),
-                "expected_tools": question.get("expected_tools", []),
-                "requires_auth": question.get("requires_auth", False),
-                "model": model_info,
-            },
-            "error": str(e),
-        }
+        return build_result(question, model_info, error=str(e))
 
 
-def write_checkpoint(
-    output_path: Path,
-    results: list[dict[str, Any]],
+async def run_inference_async(
+    question: dict[str, Any],
+    agent: Any,
     model_info: dict[str, Any],
-    total: int,
-    pretty: bool,
-) -> None:
-    """Write current results to checkpoint file."""
-    output = {
-        "run_timestamp": datetime.now().isoformat(),
-        "model": model_info,
-        "total_questions": total,
-        "completed": len(results),
-        "successful": sum(1 for r in results if r["error"] is None),
-        "failed": sum(1 for r in results if r["error"] is not None),
-        "results": results,
-    }
-    indent = 2 if pretty else None
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=indent, ensure_ascii=False, default=str)
+    cache: LLMCache | None = None,
+    max_retries: int = 5,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Run agent inference on a single question without blocking the event loop."""
+    cache_payload = {"kind": "inference", "model": model_info, "question": question["question"]}
+    if cache is not None:
+        cached = cache.get(cache_payload)
+        if cached is not None:
+            print(f"  {question['id']}: cache hit", file=sys.stderr)
+            return cached
+
+    try:
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(max_retries), wait=wait_random_exponential(min=1, max=30), retry=retry_if_exception(is_retryable), reraise=True
+        ):
+            with attempt:
+                invocation = agent.ainvoke({"messages": [{"role": "user", "content": question["question"]}]})
+                result = await (asyncio.wait_for(invocation, timeout) if timeout else invocation)
+    except NotImplementedError:
+        # Model has no async path; run the sync invoke in a worker thread instead.
+        return await asyncio.to_thread(run_inference, question, agent, model_info, max_retries)
+    except Exception as e:
+        return build_result(question, model_info, error=str(e))
+
+    messages = result.get("messages", [])
+    record = build_result(question, model_info, final_response=get_final_response(messages), trajectory=extract_trajectory(messages))
+    if cache is not None:
+        cache.set(cache_payload, record)
+    return record
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    """Return the JSONL sidecar path for an output file."""
+    return output_path.with_name(output_path.name + ".jsonl")
 
 
 def load_existing_results(path: Path) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
-    """Load existing results from a checkpoint file."""
-    if not path.exists():
+    """Load existing results from a consolidated file or its JSONL checkpoint sidecar."""
+    if path.suffix != ".jsonl" and path.exists():
+        data = orjson.loads(path.read_bytes())
+        return data.get("results", []), data.get("model")
+
+    jsonl_path = path if path.suffix == ".jsonl" else checkpoint_path(path)
+    if not jsonl_path.exists():
         return [], None
-    with open(path) as f:
-        data = json.load(f)
-    return data.get("results", []), data.get("model")
+
+    results = []
+    model = None
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            if "question_id" in record:
+                results.append(record)
+            else:
+                model = record.get("model")
+    return results, model
 
 
 def main():
     parser = argparse.ArgumentParser(description="Run agent inference on evaluation questions")
     parser.add_argument("--question-id", "-q", help="Run only a specific question by ID (e.g., q_001)")
-    parser.add_argument("--category", "-c", help="Filter by category (e.g., courses, exams, professors)")
-    parser.add_argument("--complexity", help="Filter by complexity (simple, multi_step, contextual, ambiguous)")
+    parser.add_argument("--category", "-c", action="append", help="Filter by category (repeatable, e.g., courses, exams, professors)")
+    parser.add_argument("--complexity", action="append", help="Filter by complexity (repeatable: simple, multi_step, contextual, ambiguous)")
     parser.add_argument("--skip-auth", action="store_true", help="Skip questions that require authentication")
     parser.add_argument("--output", "-o", help="Output file path (default: auto-generated with model name and timestamp)")
     parser.add_argument("--resume", "-r", help="Resume from an existing inference file (skips already completed questions)")
     parser.add_argument("--stdout", action="store_true", help="Output to stdout instead of file")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
     parser.add_argument("--limit", "-l", type=int, help="Limit to first N questions")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of questions to run concurrently (default: 4)")
+    parser.add_argument("--max-retries", type=int, default=5, help="Retry attempts for rate-limited/transient failures (default: 5)")
+    parser.add_argument("--timeout", type=float, help="Per-question timeout in seconds (default: none)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Directory for the on-disk LLM response cache")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk LLM response cache")
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        help="Skip near-duplicate questions above this similarity ratio (0-1) and copy the representative's answer",
+    )
 
     model_group = parser.add_mutually_exclusive_group()
     model_group.add_argument(
@@ -242,31 +333,31 @@ def main():
         completed_ids = {r["question_id"] for r in existing_results}
         print(f"Resuming from {resume_path} ({len(completed_ids)} questions already completed)", file=sys.stderr)
 
-    questions = load_questions()
     questions = filter_questions(
-        questions,
+        load_questions(),
         question_id=args.question_id,
-        category=args.category,
-        complexity=args.complexity,
+        categories=args.category,
+        complexities=args.complexity,
         skip_auth=args.skip_auth,
+        completed_ids=frozenset(completed_ids),
     )
 
     if args.limit:
-        questions = questions[: args.limit]
+        questions = islice(questions, args.limit)
+    questions = list(questions)
 
-    if not questions:
+    if not questions and not completed_ids:
         print("No questions match the specified filters.", file=sys.stderr)
         sys.exit(1)
 
     run_timestamp = datetime.now()
 
     if args.custom_model_class:
-        model_kwargs = json.loads(args.custom_model_kwargs)
+        model_kwargs = orjson.loads(args.custom_model_kwargs)
         print(f"Loading custom model: {args.custom_model_class}", file=sys.stderr)
         print(f"  kwargs: {model_kwargs}", file=sys.stderr)
         custom_model = load_custom_model(args.custom_model_class, model_kwargs)
-        strategy = CustomModelStrategy(custom_model)
-        agent = create_fib_agent(model=strategy)
+        model_strategy = CustomModelStrategy(custom_model)
         model_info = {
             "type": "custom",
             "class": args.custom_model_class,
@@ -274,7 +365,7 @@ def main():
         }
     else:
         print(f"Creating agent with model: {args.model}", file=sys.stderr)
-        agent = create_fib_agent(model=args.model)
+        model_strategy = create_model_strategy(args.model)
         model_info = {
             "type": "gemini",
             "name": args.model,
@@ -293,23 +384,80 @@ def main():
     if output_path:
         print(f"Results will be saved to: {output_path}", file=sys.stderr)
 
+    cache = None if args.no_cache else LLMCache(args.cache_dir)
+
     results = list(existing_results)
-    total = len(questions)
-    remaining = [q for q in questions if q["id"] not in completed_ids]
+    remaining = questions
+    total = len(remaining) + len(completed_ids)
+
+    duplicates: list[tuple[dict[str, Any], str]] = []
+    if args.dedup_threshold:
+        remaining, duplicates = dedup_questions(remaining, args.dedup_threshold)
+        if duplicates:
+            print(f"Deduplicated {len(duplicates)} near-duplicate questions", file=sys.stderr)
     print(f"Running {len(remaining)} remaining questions out of {total} total", file=sys.stderr)
 
-    for i, question in enumerate(remaining, len(completed_ids) + 1):
-        print(f"[{i}/{total}] Running: {question['id']} - {question['question'][:50]}...", file=sys.stderr)
-        result = run_inference(question, agent, model_info)
-        results.append(result)
-
-        if result["error"]:
-            print(f"  Error: {result['error']}", file=sys.stderr)
-        else:
-            print("  Done.", file=sys.stderr)
-
-        if output_path:
-            write_checkpoint(output_path, results, model_info, total, args.pretty)
+    # Append one line per completed question; the consolidated JSON is written once at the end.
+    checkpoint_file = None
+    if output_path:
+        checkpoint_file = open(checkpoint_path(output_path), "ab")
+        if checkpoint_file.tell() == 0:
+            header = {"run_timestamp": run_timestamp.isoformat(), "model": model_info, "total_questions": total}
+            checkpoint_file.write(orjson.dumps(header, default=str) + b"\n")
+            checkpoint_file.flush()
+
+    async def run_remaining() -> None:
+        semaphore = asyncio.Semaphore(max(args.concurrency, 1))
+
+        async def bounded(question: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                print(f"Running: {question['id']} - {question['question'][:50]}...", file=sys.stderr)
+                # Agents are stateful and not coroutine-safe, so each task builds its own
+                # over the shared strategy; the underlying chat model is safe to share.
+                agent = create_fib_agent(model=model_strategy)
+                return await run_inference_async(question, agent, model_info, cache=cache, max_retries=args.max_retries, timeout=args.timeout)
+
+        tasks = [asyncio.create_task(bounded(question)) for question in remaining]
+        completed = len(completed_ids)
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            results.append(result)
+            completed += 1
+
+            if result["error"]:
+                print(f"[{completed}/{total}] {result['question_id']}: Error: {result['error']}", file=sys.stderr)
+            else:
+                print(f"[{completed}/{total}] {result['question_id']}: Done.", file=sys.stderr)
+
+            if checkpoint_file:
+                checkpoint_file.write(orjson.dumps(result, default=str) + b"\n")
+                checkpoint_file.flush()
+
+    asyncio.run(run_remaining())
+
+    # Fill in near-duplicates by copying their representative's answer.
+    if duplicates:
+        by_id = {r["question_id"]: r for r in results}
+        for question, representative_id in duplicates:
+            representative = by_id.get(representative_id)
+            if representative is None:
+                continue
+            record = build_result(
+                question,
+                model_info,
+                final_response=representative["final_response"],
+                trajectory=representative["trajectory"],
+                error=representative["error"],
+            )
+            record["deduplicated_from"] = representative_id
+            results.append(record)
+            if checkpoint_file:
+                checkpoint_file.write(orjson.dumps(record, default=str) + b"\n")
+        if checkpoint_file:
+            checkpoint_file.flush()
+
+    if checkpoint_file:
+        checkpoint_file.close()
 
     output = {
         "run_timestamp": run_timestamp.isoformat(),
@@ -321,13 +469,14 @@ def main():
         "results": results,
     }
 
-    indent = 2 if args.pretty else None
-    json_output = json.dumps(output, indent=indent, ensure_ascii=False, default=str)
+    option = orjson.OPT_INDENT_2 if args.pretty else 0
+    json_output = orjson.dumps(output, option=option, default=str)
 
     if output_path:
+        output_path.write_bytes(json_output)
         print(f"Results written to {output_path}", file=sys.stderr)
     else:
-        print(json_output)
+        print(json_output.decode())
 
 
 if __name__ == "__main__":
@@ -6,14 +6,24 @@ defined in evaluation/dataset/metrics.json.
 """
 
 import argparse
-import json
+import asyncio
+import copy
+import functools
 import os
+import signal
 import sys
+import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import ijson
+import numpy as np
+import orjson
 from dotenv import load_dotenv
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 load_dotenv()
 
@@ -21,6 +31,8 @@ from deepeval.metrics import GEval  # noqa: E402
 from deepeval.models import DeepEvalBaseLLM, GeminiModel  # noqa: E402
 from deepeval.test_case import LLMTestCase, LLMTestCaseParams  # noqa: E402
 
+from scripts._llm_cache import DEFAULT_CACHE_DIR, LLMCache  # noqa: E402
+
 
 class FixedGeminiModel(GeminiModel):
     """GeminiModel with fix for use_vertexai bool/str type mismatch bug in deepeval."""
@@ -32,30 +44,95 @@ class FixedGeminiModel(GeminiModel):
         return False
 
 
+class BatchingGeminiModel(FixedGeminiModel):
+    """FixedGeminiModel that coalesces concurrent judge calls into flush windows.
+
+    Gemini's batch endpoint is offline-only (hours of turnaround), so each window is
+    dispatched as one concurrent burst over the shared client; swap the drain body for
+    a true batch RPC once the SDK exposes an online batchGenerateContent.
+    """
+
+    def __init__(self, *args, batch_size: int = 8, flush_interval: float = 0.05, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._drainer: asyncio.Task | None = None
+
+    async def a_generate(self, prompt: str, schema: Any = None) -> Any:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._drainer = asyncio.create_task(self._drain())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((prompt, schema, future))
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            window = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(window) < self._batch_size and (timeout := deadline - loop.time()) > 0:
+                try:
+                    window.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            parent = super()
+            responses = await asyncio.gather(*(parent.a_generate(prompt, schema=schema) for prompt, schema, _ in window), return_exceptions=True)
+            for (_, _, future), response in zip(window, responses, strict=True):
+                if isinstance(response, BaseException):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+
+    async def aclose(self) -> None:
+        if self._drainer is not None:
+            self._drainer.cancel()
+            self._drainer = None
+
+
 METRICS_PATH = Path(__file__).parent.parent / "evaluation" / "dataset" / "metrics.json"
 RESULTS_DIR = Path(__file__).parent.parent / "evaluation" / "results"
 
+RETRYABLE_EXCEPTION_NAMES = frozenset({"ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError", "DeadlineExceeded"})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Treat rate limits, transient server errors and timeouts as retryable."""
+    return (
+        isinstance(error, TimeoutError) or type(error).__name__ in RETRYABLE_EXCEPTION_NAMES or getattr(error, "code", None) in RETRYABLE_STATUS_CODES
+    )
+
 
-def create_model(model_str: str) -> str | DeepEvalBaseLLM:
-    """Create the appropriate model instance based on the model string."""
+@functools.lru_cache(maxsize=8)
+def create_model(model_str: str, judge_batch_size: int = 0) -> str | DeepEvalBaseLLM:
+    """Create the appropriate model instance based on the model string, memoized per run configuration."""
     if model_str.startswith("gemini/"):
         model_name = model_str[len("gemini/") :]
         # API key is optional when using Vertex AI with ADC authentication
         api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+        if judge_batch_size > 0:
+            return BatchingGeminiModel(model=model_name, api_key=api_key, batch_size=judge_batch_size)
         return FixedGeminiModel(model=model_name, api_key=api_key)
     return model_str
 
 
 def load_metrics(path: Path = METRICS_PATH) -> list[dict[str, Any]]:
     """Load metric definitions from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
+
 
+def load_inference_model(path: Path) -> dict[str, Any]:
+    """Parse only the model info header without materializing the results array."""
+    with open(path, "rb") as f:
+        return next(ijson.items(f, "model", use_float=True), {})
 
-def load_inference_results(path: Path) -> dict[str, Any]:
-    """Load inference results from JSON file."""
-    with open(path) as f:
-        return json.load(f)
+
+def iter_inference_results(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream inference result records one at a time."""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "results.item", use_float=True)
 
 
 def create_geval_metric(metric_def: dict[str, Any], model: str | DeepEvalBaseLLM) -> GEval:
@@ -92,7 +169,7 @@ def format_output_with_trajectory(result: dict[str, Any]) -> str:
         if msg.get("type") == "ai" and msg.get("tool_calls"):
             for tc in msg["tool_calls"]:
                 tool_calls_found = True
-                args_str = json.dumps(tc.get("args", {}), ensure_ascii=False)
+                args_str = orjson.dumps(tc.get("args", {})).decode()
                 output += f"- {tc['name']}({args_str})\n"
 
     if not tool_calls_found:
@@ -129,13 +206,13 @@ def create_test_case(
 
 
 def filter_results(
-    results: list[dict[str, Any]],
+    results: Iterable[dict[str, Any]],
     question_id: str | None = None,
-) -> list[dict[str, Any]]:
-    """Filter inference results based on criteria."""
+) -> Iterator[dict[str, Any]]:
+    """Filter inference results lazily based on criteria."""
     if question_id:
-        return [r for r in results if r["question_id"] == question_id]
-    return results
+        return (r for r in results if r["question_id"] == question_id)
+    return iter(results)
 
 
 def extract_model_name(model_info: dict[str, Any]) -> str:
@@ -168,10 +245,13 @@ def write_checkpoint(
     metric_ids: list[str],
     total: int,
     pretty: bool,
+    summary: dict[str, Any] | None = None,
+    result_blobs: list[bytes] | None = None,
 ) -> None:
     """Write current results to checkpoint file."""
-    summary = compute_summary(eval_results, metric_ids)
-    output = {
+    if summary is None:
+        summary = compute_summary(eval_results, metric_ids)
+    header = {
         "eval_timestamp": datetime.now().isoformat(),
         "inference_file": inference_file,
         "eval_model": eval_model,
@@ -179,14 +259,99 @@ def write_checkpoint(
         "total_questions": total,
         "completed": len(eval_results),
         "summary": summary,
-        "results": eval_results,
     }
-    indent = 2 if pretty else None
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=indent, ensure_ascii=False, default=str)
 
+    if pretty or result_blobs is None:
+        output = {**header, "results": eval_results}
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        output_path.write_bytes(orjson.dumps(output, option=option, default=str))
+        return
+
+    # Finished results are immutable, so splice their cached bytes instead of re-encoding
+    # the whole array on every flush.
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(header, default=str)[:-1])
+        f.write(b',"results":[')
+        f.write(b",".join(result_blobs))
+        f.write(b"]}")
+
+
+async def evaluate_result(
+    result: dict[str, Any],
+    question_id: str,
+    metric_objs: list[tuple[dict[str, Any], GEval]],
+    model_key: str,
+    cache: LLMCache | None,
+    verbose: bool,
+    max_retries: int = 3,
+) -> dict[str, Any]:
+    """Evaluate one inference result, running every metric's judge call concurrently."""
+    question_scores = {
+        "question_id": question_id,
+        "question": result.get("question", ""),
+        "final_response": result.get("final_response"),
+        "scores": {},
+    }
+
+    async def measure(metric_def: dict[str, Any], prebuilt: GEval) -> tuple[str, dict[str, Any]]:
+        metric_id = metric_def["id"]
+        metric_name = metric_def["name"]
+
+        include_trajectory = metric_id == "tool_appropriateness"
+        test_case = create_test_case(result, include_trajectory=include_trajectory)
+
+        # The judge runs at temperature 0, so identical (model, metric, input, output) is deterministic.
+        cache_payload = {
+            "kind": "judge",
+            "model": model_key,
+            "metric": metric_id,
+            "input": test_case.input,
+            "actual_output": test_case.actual_output,
+        }
+        if cache is not None:
+            cached = cache.get(cache_payload)
+            if cached is not None:
+                if verbose:
+                    print(f"  {question_id} {metric_name}: {cached['score']:.2f} (cached)", file=sys.stderr)
+                return metric_id, cached
+
+        # Shallow-copy the prebuilt metric so concurrent measures don't share score/reason state.
+        geval_metric = copy.copy(prebuilt)
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(max_retries),
+                wait=wait_random_exponential(min=1, max=30),
+                retry=retry_if_exception(is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    await geval_metric.a_measure(test_case)
+            if verbose:
+                print(f"  {question_id} {metric_name}: {geval_metric.score:.2f}", file=sys.stderr)
+            payload = {
+                "score": geval_metric.score,
+                "reason": geval_metric.reason,
+            }
+            if cache is not None:
+                cache.set(cache_payload, payload)
+            return metric_id, payload
+        except Exception as e:
+            if verbose:
+                print(f"  {question_id} {metric_name}: ERROR - {e}", file=sys.stderr)
+            return metric_id, {
+                "score": None,
+                "reason": None,
+                "error": str(e),
+            }
 
-def run_evaluation(
+    for metric_id, payload in await asyncio.gather(*(measure(md, prebuilt) for md, prebuilt in metric_objs)):
+        question_scores["scores"][metric_id] = payload
+
+    return question_scores
+
+
+async def run_evaluation(
     results: list[dict[str, Any]],
     metric_defs: list[dict[str, Any]],
     model: str | DeepEvalBaseLLM,
@@ -194,69 +359,102 @@ def run_evaluation(
     inference_file: str = "",
     pretty: bool = False,
     verbose: bool = True,
+    concurrency: int = 4,
+    cache: LLMCache | None = None,
+    judge_batch_size: int = 0,
+    checkpoint_every: int = 5,
+    checkpoint_interval: float = 30.0,
+    max_retries: int = 3,
+    evaluate_errors: bool = False,
 ) -> list[dict[str, Any]]:
-    """Run evaluation on all results with all metrics."""
+    """Run evaluation on all results with all metrics, bounded by a question-level semaphore."""
     eval_results = []
     metric_ids = [m["id"] for m in metric_defs]
     total = len(results)
 
-    model_instance = create_model(model) if isinstance(model, str) else model
+    model_instance = create_model(model, judge_batch_size=judge_batch_size) if isinstance(model, str) else model
+    model_key = model if isinstance(model, str) else type(model).__name__
+    # Build each metric once; the criteria concatenation and GEval setup are per-run costs.
+    metric_objs = [(md, create_geval_metric(md, model_instance)) for md in metric_defs]
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
 
-    for i, result in enumerate(results, 1):
+    async def bounded(i: int, result: dict[str, Any]) -> dict[str, Any]:
         question_id = result.get("question_id", f"unknown_{i}")
-        try:
-            if verbose:
-                print(f"[{i}/{total}] Evaluating: {question_id}", file=sys.stderr)
 
-            question_scores = {
+        # The judge is guaranteed to score these 0, so don't spend N tokens confirming it.
+        if not evaluate_errors and (result.get("error") or not result.get("final_response")):
+            if verbose:
+                print(f"[{i}/{total}] Skipping judge for {question_id}: inference error / empty response", file=sys.stderr)
+            sentinel = {"score": 0.0, "reason": "skipped: inference error / empty response"}
+            return {
                 "question_id": question_id,
                 "question": result.get("question", ""),
                 "final_response": result.get("final_response"),
-                "scores": {},
+                "scores": {metric_id: dict(sentinel) for metric_id in metric_ids},
             }
 
-            for metric_def in metric_defs:
-                metric_id = metric_def["id"]
-                metric_name = metric_def["name"]
-
-                include_trajectory = metric_id == "tool_appropriateness"
-                test_case = create_test_case(result, include_trajectory=include_trajectory)
-
-                geval_metric = create_geval_metric(metric_def, model_instance)
-
-                try:
-                    geval_metric.measure(test_case)
-                    question_scores["scores"][metric_id] = {
-                        "score": geval_metric.score,
-                        "reason": geval_metric.reason,
-                    }
-                    if verbose:
-                        print(f"  {metric_name}: {geval_metric.score:.2f}", file=sys.stderr)
-                except Exception as e:
-                    question_scores["scores"][metric_id] = {
-                        "score": None,
-                        "reason": None,
-                        "error": str(e),
-                    }
-                    if verbose:
-                        print(f"  {metric_name}: ERROR - {e}", file=sys.stderr)
-
-            eval_results.append(question_scores)
-        except Exception as e:
+        async with semaphore:
             if verbose:
-                print(f"[{i}/{total}] SKIPPED {question_id}: {e}", file=sys.stderr)
-            eval_results.append(
-                {
+                print(f"[{i}/{total}] Evaluating: {question_id}", file=sys.stderr)
+            try:
+                return await evaluate_result(result, question_id, metric_objs, model_key, cache, verbose, max_retries=max_retries)
+            except Exception as e:
+                if verbose:
+                    print(f"[{i}/{total}] SKIPPED {question_id}: {e}", file=sys.stderr)
+                return {
                     "question_id": question_id,
                     "question": result.get("question", ""),
                     "final_response": result.get("final_response"),
                     "scores": {},
                     "error": str(e),
                 }
+
+    # Maintain running (sum, count) per metric so each checkpoint summary is O(M),
+    # not a rescan of every accumulated result.
+    metric_index = {metric_id: col for col, metric_id in enumerate(metric_ids)}
+    running_sums = np.zeros(len(metric_ids))
+    running_counts = np.zeros(len(metric_ids), dtype=np.int64)
+
+    def running_summary() -> dict[str, Any]:
+        return {
+            "total_questions": len(eval_results),
+            "avg_scores": {
+                metric_id: float(running_sums[col] / running_counts[col]) for metric_id, col in metric_index.items() if running_counts[col]
+            },
+        }
+
+    # Re-serializing the whole results array per question dominates on fast/cached runs,
+    # so only flush once either threshold trips; the finally block guarantees a last write.
+    last_flush = time.monotonic()
+    unflushed = 0
+    result_blobs: list[bytes] = []
+
+    tasks = [asyncio.create_task(bounded(i, result)) for i, result in enumerate(results, 1)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            record = await task
+            eval_results.append(record)
+            result_blobs.append(orjson.dumps(record, default=str))
+            unflushed += 1
+            for metric_id, payload in record["scores"].items():
+                if payload.get("score") is not None:
+                    running_sums[metric_index[metric_id]] += payload["score"]
+                    running_counts[metric_index[metric_id]] += 1
+
+            if output_path and (unflushed >= checkpoint_every or time.monotonic() - last_flush >= checkpoint_interval):
+                write_checkpoint(
+                    output_path, eval_results, inference_file, model, metric_ids, total, pretty, summary=running_summary(), result_blobs=result_blobs
+                )
+                last_flush = time.monotonic()
+                unflushed = 0
+    finally:
+        if output_path and unflushed:
+            write_checkpoint(
+                output_path, eval_results, inference_file, model, metric_ids, total, pretty, summary=running_summary(), result_blobs=result_blobs
             )
 
-        if output_path:
-            write_checkpoint(output_path, eval_results, inference_file, model, metric_ids, total, pretty)
+    if isinstance(model_instance, BatchingGeminiModel):
+        await model_instance.aclose()
 
     return eval_results
 
@@ -265,16 +463,19 @@ def compute_summary(
     eval_results: list[dict[str, Any]],
     metric_ids: list[str],
 ) -> dict[str, Any]:
-    """Compute summary statistics from evaluation results."""
-    avg_scores = {}
-    for metric_id in metric_ids:
-        scores = [r["scores"][metric_id]["score"] for r in eval_results if r["scores"].get(metric_id, {}).get("score") is not None]
-        if scores:
-            avg_scores[metric_id] = sum(scores) / len(scores)
-
+    """Compute summary statistics from evaluation results in one vectorized pass."""
+    scores = np.full((len(eval_results), len(metric_ids)), np.nan)
+    for row, r in enumerate(eval_results):
+        for col, metric_id in enumerate(metric_ids):
+            score = r["scores"].get(metric_id, {}).get("score")
+            if score is not None:
+                scores[row, col] = score
+
+    counts = np.sum(~np.isnan(scores), axis=0)
+    sums = np.nansum(scores, axis=0)
     return {
         "total_questions": len(eval_results),
-        "avg_scores": avg_scores,
+        "avg_scores": {metric_id: float(sums[col] / counts[col]) for col, metric_id in enumerate(metric_ids) if counts[col]},
     }
 
 
@@ -288,6 +489,14 @@ def main():
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
     parser.add_argument("--stdout", action="store_true", help="Output to stdout instead of file")
     parser.add_argument("--limit", "-l", type=int, help="Limit to first N questions")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of questions to evaluate concurrently (default: 4)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Directory for the on-disk judge response cache")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk judge response cache")
+    parser.add_argument("--judge-batch-size", type=int, default=0, help="Coalesce up to N concurrent judge calls per dispatch window (0 disables)")
+    parser.add_argument("--checkpoint-every", type=int, default=5, help="Write the checkpoint file after every N completed questions (default: 5)")
+    parser.add_argument("--checkpoint-interval-seconds", type=float, default=30.0, help="Also checkpoint when this many seconds elapse (default: 30)")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retry attempts per judge call for rate-limited/transient failures (default: 3)")
+    parser.add_argument("--evaluate-errors", action="store_true", help="Run the judge even on errored or empty inference results")
 
     args = parser.parse_args()
 
@@ -297,13 +506,11 @@ def main():
         sys.exit(1)
 
     print(f"Loading inference results from: {inference_path}", file=sys.stderr)
-    inference_data = load_inference_results(inference_path)
-    results = inference_data.get("results", [])
-
-    results = filter_results(results, question_id=args.question_id)
+    results = filter_results(iter_inference_results(inference_path), question_id=args.question_id)
 
     if args.limit:
-        results = results[: args.limit]
+        results = islice(results, args.limit)
+    results = list(results)
 
     if not results:
         print("No results to evaluate.", file=sys.stderr)
@@ -328,25 +535,37 @@ def main():
 
     run_timestamp = datetime.now()
 
+    # Let SIGTERM unwind like Ctrl-C so the in-flight checkpoint still gets written.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+
     if args.stdout:
         output_path = None
     elif args.output:
         output_path = Path(args.output)
     else:
         RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-        model_info = inference_data.get("model", {})
+        model_info = load_inference_model(inference_path)
         output_path = RESULTS_DIR / generate_output_filename(model_info, run_timestamp)
 
     if output_path:
         print(f"Results will be saved to: {output_path}", file=sys.stderr)
 
-    eval_results = run_evaluation(
-        results,
-        metric_defs,
-        args.model,
-        output_path=output_path,
-        inference_file=inference_path.name,
-        pretty=args.pretty,
+    eval_results = asyncio.run(
+        run_evaluation(
+            results,
+            metric_defs,
+            args.model,
+            output_path=output_path,
+            inference_file=inference_path.name,
+            pretty=args.pretty,
+            concurrency=args.concurrency,
+            cache=None if args.no_cache else LLMCache(args.cache_dir),
+            judge_batch_size=args.judge_batch_size,
+            checkpoint_every=args.checkpoint_every,
+            checkpoint_interval=args.checkpoint_interval_seconds,
+            max_retries=args.max_retries,
+            evaluate_errors=args.evaluate_errors,
+        )
     )
 
     summary = compute_summary(eval_results, metric_ids)
@@ -362,8 +581,8 @@ def main():
         "results": eval_results,
     }
 
-    indent = 2 if args.pretty else None
-    json_output = json.dumps(output, indent=indent, ensure_ascii=False, default=str)
+    option = orjson.OPT_INDENT_2 if args.pretty else 0
+    json_output = orjson.dumps(output, option=option, default=str).decode()
 
     if args.stdout:
         print(json_output)
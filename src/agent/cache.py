@@ -0,0 +1,193 @@
+"""
+Response caching for the FIB agent.
+
+Provides a two-tier cache: an exact tier keyed on a SHA-256 of the normalized
+query and a similarity tier that matches close paraphrases, so repeated or
+near-identical questions skip the full LLM pipeline (and internet_search skips
+repeat Tavily calls).
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+EXACT_CACHE_DIR = Path.home() / ".cache" / "fib-agent" / "exact"
+
+
+def _normalize(text: str) -> str:
+    """Normalize a query for cache lookup (case/whitespace insensitive)."""
+    return " ".join(text.lower().split())
+
+
+def cache_key(model: str, messages: list[Any], tools: list[str], temperature: float = 0.0) -> str:
+    """Deterministic key over everything that affects a temperature-0 agent response."""
+    payload = {
+        "model": model,
+        "messages": [m if isinstance(m, dict) else {"type": type(m).__name__, "content": getattr(m, "content", str(m))} for m in messages],
+        "tools": sorted(tools),
+        "temperature": temperature,
+    }
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class ExactDiskCache:
+    """Pickle-backed exact-match store under ~/.cache/fib-agent/exact that survives restarts."""
+
+    def __init__(self, cache_dir: Path | str = EXACT_CACHE_DIR):
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Any | None:
+        path = self._dir / f"{key}.pkl"
+        if not path.exists():
+            return None
+        try:
+            return pickle.loads(path.read_bytes())
+        except Exception:
+            # A corrupt or version-incompatible entry is just a miss.
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            blob = pickle.dumps(value)
+        except Exception:
+            return
+        path = self._dir / f"{key}.pkl"
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(blob)
+        os.replace(temporary, path)
+
+
+class SemanticCache:
+    """In-memory query cache with an exact hash tier and a similarity fallback tier."""
+
+    def __init__(self, threshold: float = 0.92, ttl: float = 3600.0, max_entries: int = 256):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # exact key -> (inserted_at, value); insertion order doubles as eviction order
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # (variant, normalized query text) -> exact key, scanned by the similarity tier
+        self._texts: dict[tuple[str, str], str] = {}
+
+    @staticmethod
+    def _key(normalized: str, variant: str = "") -> str:
+        return hashlib.sha256(f"{normalized}|{variant}".encode()).hexdigest()
+
+    def _fresh(self, key: str, now: float) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or now - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def get(self, query: str, variant: str = "") -> Any | None:
+        """Return a cached value for the query, or None. Exact match first, then similarity."""
+        now = time.monotonic()
+        normalized = _normalize(query)
+        value = self._fresh(self._key(normalized, variant), now)
+        if value is not None:
+            return value
+
+        # Only same-variant entries are candidates: a hit for another topic or
+        # max_results would return results the caller didn't ask for.
+        for (entry_variant, text), key in self._texts.items():
+            if entry_variant != variant:
+                continue
+            if SequenceMatcher(None, normalized, text).ratio() >= self.threshold:
+                value = self._fresh(key, now)
+                if value is not None:
+                    return value
+        return None
+
+    def set(self, query: str, value: Any, variant: str = "") -> None:
+        """Store a value for the query, evicting the oldest entry when full."""
+        normalized = _normalize(query)
+        key = self._key(normalized, variant)
+        self._entries[key] = (time.monotonic(), value)
+        self._texts[(variant, normalized)] = key
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+            self._texts = {pair: k for pair, k in self._texts.items() if k != oldest}
+
+
+class CachedAgent:
+    """Wraps an agent graph so repeated queries short-circuit the LLM round-trip."""
+
+    def __init__(
+        self,
+        graph: Any,
+        cache: SemanticCache,
+        exact_cache: ExactDiskCache | None = None,
+        model: str = "",
+        tools: tuple[str, ...] = (),
+        temperature: float = 0.0,
+    ):
+        self._graph = graph
+        self._cache = cache
+        # The disk tier is only deterministic at temperature 0 (the deepagents default).
+        self._exact_cache = exact_cache if temperature == 0 else None
+        self._model = model
+        self._tools = list(tools)
+        self._temperature = temperature
+
+    def _exact_key(self, state: dict[str, Any]) -> str | None:
+        if self._exact_cache is None:
+            return None
+        return cache_key(self._model, state.get("messages") or [], self._tools, self._temperature)
+
+    def _lookup(self, query: str | None, exact_key: str | None) -> Any | None:
+        if exact_key is not None:
+            cached = self._exact_cache.get(exact_key)
+            if cached is not None:
+                return cached
+        if query is not None:
+            return self._cache.get(query)
+        return None
+
+    def _store(self, query: str | None, exact_key: str | None, result: Any) -> None:
+        if exact_key is not None:
+            self._exact_cache.set(exact_key, result)
+        if query is not None:
+            self._cache.set(query, result)
+
+    @staticmethod
+    def _query_text(state: dict[str, Any]) -> str | None:
+        messages = state.get("messages") or []
+        # Only single-turn states are cacheable; multi-turn context changes the answer.
+        if len(messages) != 1:
+            return None
+        last = messages[-1]
+        content = last.get("content") if isinstance(last, dict) else getattr(last, "content", None)
+        return content if isinstance(content, str) else None
+
+    def invoke(self, state: dict[str, Any], **kwargs: Any) -> Any:
+        query = self._query_text(state)
+        exact_key = self._exact_key(state)
+        cached = self._lookup(query, exact_key)
+        if cached is not None:
+            return cached
+        result = self._graph.invoke(state, **kwargs)
+        self._store(query, exact_key, result)
+        return result
+
+    async def ainvoke(self, state: dict[str, Any], **kwargs: Any) -> Any:
+        query = self._query_text(state)
+        exact_key = self._exact_key(state)
+        cached = self._lookup(query, exact_key)
+        if cached is not None:
+            return cached
+        result = await self._graph.ainvoke(state, **kwargs)
+        self._store(query, exact_key, result)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate everything else (stream, get_graph, ...) to the wrapped graph.
+        return getattr(self._graph, name)
@@ -5,15 +5,17 @@ This agent uses a subagent for public FIB API queries and keeps private tools
 at the root level for user-specific data access.
 """
 
-from abc import ABC, abstractmethod
+import asyncio
+import functools
+import threading
+import time
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal, Protocol, runtime_checkable
 
-from deepagents import create_deep_agent
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tavily import TavilyClient
 
+from src.agent.cache import CachedAgent, ExactDiskCache, SemanticCache
+from src.agent.parallel import ToolConcurrencyMiddleware
 from src.api import configure_oauth
 from src.tools import (
     get_academic_terms,
@@ -37,16 +39,14 @@ GEMINI_MODELS = frozenset({"gemini-2.5-flash", "gemini-2.5-flash-lite", "gemini-
 GENAI_SDK_MODELS = frozenset({"gemini-3-flash-preview"})
 
 
-class ModelStrategy(ABC):
-    """Abstract base class for model selection strategies."""
+@runtime_checkable
+class ModelStrategy(Protocol):
+    """Structural interface for model selection strategies; satisfied by any object with get_model."""
 
-    @abstractmethod
-    def get_model(self) -> str | BaseChatModel:
-        """Return the model to use for agent creation."""
-        pass
+    def get_model(self) -> str | BaseChatModel: ...
 
 
-class GeminiModelStrategy(ModelStrategy):
+class GeminiModelStrategy:
     """Strategy for Google Gemini models specified by name."""
 
     def __init__(self, model_name: str = "gemini-2.5-flash"):
@@ -56,11 +56,14 @@ class GeminiModelStrategy(ModelStrategy):
 
     def get_model(self) -> str | BaseChatModel:
         if self._model_name in GENAI_SDK_MODELS:
+            # Deferred: the google-genai SDK stack is only needed for these models.
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             return ChatGoogleGenerativeAI(model=self._model_name, vertexai=True, location="global")
         return self._model_name
 
 
-class CustomModelStrategy(ModelStrategy):
+class CustomModelStrategy:
     """Strategy for custom BaseChatModel instances (e.g., local models)."""
 
     def __init__(self, model: BaseChatModel):
@@ -70,7 +73,16 @@ class CustomModelStrategy(ModelStrategy):
         return self._model
 
 
-tavily_client = TavilyClient()
+@functools.cache
+def _get_tavily():
+    """Lazily construct the Tavily client on first search (avoids import-time HTTP session)."""
+    from tavily import TavilyClient
+
+    return TavilyClient()
+
+
+# Near-identical searches within a few minutes return the same results; cache them.
+_search_cache = SemanticCache(threshold=0.95, ttl=600.0)
 
 
 def internet_search(
@@ -80,12 +92,51 @@ def internet_search(
     include_raw_content: bool = False,
 ):
     """Run a web search for information not available in FIB API."""
-    return tavily_client.search(
+    variant = f"{topic}|{max_results}|{include_raw_content}"
+    cached = _search_cache.get(query, variant=variant)
+    if cached is not None:
+        return cached
+    result = _get_tavily().search(
         query,
         max_results=max_results,
         include_raw_content=include_raw_content,
         topic=topic,
     )
+    _search_cache.set(query, result, variant=variant)
+    return result
+
+
+def internet_search_batch(
+    queries: list[str],
+    max_results: int = 5,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = False,
+):
+    """Run several related web searches concurrently in a single tool call."""
+    variant = f"{topic}|{max_results}|{include_raw_content}"
+    results: dict[str, Any] = {}
+    missing = []
+    for query in queries:
+        cached = _search_cache.get(query, variant=variant)
+        if cached is not None:
+            results[query] = cached
+        else:
+            missing.append(query)
+
+    if missing:
+        from tavily import AsyncTavilyClient
+
+        async def gather_searches():
+            client = AsyncTavilyClient()
+            return await asyncio.gather(
+                *(client.search(q, max_results=max_results, include_raw_content=include_raw_content, topic=topic) for q in missing)
+            )
+
+        for query, result in zip(missing, asyncio.run(gather_searches()), strict=True):
+            _search_cache.set(query, result, variant=variant)
+            results[query] = result
+
+    return [results[query] for query in queries]
 
 
 PUBLIC_FIB_SYSTEM_PROMPT = """You are a specialized FIB (Facultat d'Informàtica de Barcelona) public data assistant.
@@ -259,6 +310,8 @@ Which program are you interested in?"
 - `internet_search`: Search the web for information **not available** in FIB tools.
   - **USE FOR**: Job market info, external rankings, general CS career advice, non-FIB events, industry trends
   - **DO NOT USE FOR**: FIB course info, exam schedules, professor contacts, university news, current date/time
+- `internet_search_batch`: Same as `internet_search` but takes a list of queries and runs them concurrently.
+  - **USE WHEN**: You need 2+ related web searches in one turn - one batch call instead of repeated single searches
 
 ## Subagent: public-fib-agent
 
@@ -361,6 +414,10 @@ PRIVATE_TOOLS = [
     get_my_notices,
 ]
 
+# Prebuilt once; create_deep_agent takes any Sequence, so no per-call copy is needed.
+_PRIVATE_TOOLS_TUPLE = tuple(PRIVATE_TOOLS)
+_PRIVATE_TOOLS_WITH_SEARCH = (*PRIVATE_TOOLS, internet_search, internet_search_batch)
+
 
 PUBLIC_FIB_SUBAGENT = {
     "name": "public-fib-agent",
@@ -381,6 +438,22 @@ def create_model_strategy(model: str | BaseChatModel) -> ModelStrategy:
     return CustomModelStrategy(model)
 
 
+def _resolve_model(model: str | BaseChatModel | ModelStrategy) -> str | BaseChatModel:
+    """Resolve a model spec to what deepagents accepts, without the strategy indirection."""
+    if isinstance(model, ModelStrategy):
+        return model.get_model()
+    if not isinstance(model, str):
+        return model
+    if model not in GEMINI_MODELS:
+        raise ValueError(f"Unknown Gemini model: {model}. Supported: {GEMINI_MODELS}")
+    if model in GENAI_SDK_MODELS:
+        # Deferred: the google-genai SDK stack is only needed for these models.
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=model, vertexai=True, location="global")
+    return model
+
+
 WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
 
@@ -398,10 +471,110 @@ def _get_formatted_system_prompt() -> str:
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _compile_public_subagent(model_name: str, cache_handle: str | None = None):
+    """Compile the public FIB subagent graph once per model name (and cache handle) and reuse it across agent creations."""
+    from deepagents.middleware.filesystem import FilesystemMiddleware
+    from deepagents.middleware.patch_tool_calls import PatchToolCallsMiddleware
+    from langchain.agents import create_agent
+    from langchain.agents.middleware import TodoListMiddleware
+    from langchain.agents.middleware.summarization import SummarizationMiddleware
+    from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
+
+    model: str | BaseChatModel = model_name
+    system_prompt: str | None = PUBLIC_FIB_SYSTEM_PROMPT
+    if cache_handle is not None:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        # The cache carries the system instruction; Gemini rejects sending it inline too.
+        model = ChatGoogleGenerativeAI(model=model_name, vertexai=True, location="global", cached_content=cache_handle)
+        system_prompt = None
+
+    # Mirrors the default middleware deepagents applies when compiling subagents from a dict spec.
+    return create_agent(
+        model,
+        system_prompt=system_prompt,
+        tools=PUBLIC_TOOLS,
+        middleware=[
+            TodoListMiddleware(),
+            FilesystemMiddleware(),
+            SummarizationMiddleware(model=model_name, max_tokens_before_summary=170000, messages_to_keep=6),
+            AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore"),
+            PatchToolCallsMiddleware(),
+        ],
+    )
+
+
+def _public_subagent_spec(resolved_model: str | BaseChatModel, cache_handle: str | None = None) -> dict[str, Any]:
+    """Return the subagent spec, prebuilt and cached when the model is addressed by name."""
+    if not isinstance(resolved_model, str):
+        # Model instances are not reliably hashable, so their subgraphs cannot be memoized.
+        return PUBLIC_FIB_SUBAGENT
+    return {
+        "name": PUBLIC_FIB_SUBAGENT["name"],
+        "description": PUBLIC_FIB_SUBAGENT["description"],
+        "runnable": _compile_public_subagent(resolved_model, cache_handle),
+    }
+
+
+_PROMPT_CACHE_TTL = 3600
+# Refresh well before the TTL lapses so a handle baked into a live model never expires under it.
+_PROMPT_CACHE_REFRESH_MARGIN = 600
+
+# (model name, prompt) -> (handle, monotonic expiry); the refresh timer extends the TTL of the
+# same cachedContents resource in place, keeping handles valid for long-lived agents.
+_prompt_cache_handles: dict[tuple[str, str], tuple[str, float]] = {}
+
+
+def _schedule_prompt_cache_refresh(key: tuple[str, str], handle: str) -> None:
+    timer = threading.Timer(_PROMPT_CACHE_TTL - _PROMPT_CACHE_REFRESH_MARGIN, _refresh_prompt_cache, args=(key, handle))
+    timer.daemon = True
+    timer.start()
+
+
+def _refresh_prompt_cache(key: tuple[str, str], handle: str) -> None:
+    """Extend a live cache handle's TTL; on failure, drop it so the next agent creation starts fresh."""
+    try:
+        from google import genai
+        from google.genai import types
+
+        genai.Client(vertexai=True).caches.update(name=handle, config=types.UpdateCachedContentConfig(ttl=f"{_PROMPT_CACHE_TTL}s"))
+    except Exception:
+        _prompt_cache_handles.pop(key, None)
+        return
+    _prompt_cache_handles[key] = (handle, time.monotonic() + _PROMPT_CACHE_TTL)
+    _schedule_prompt_cache_refresh(key, handle)
+
+
+def _create_prompt_cache(model_name: str, system_prompt: str) -> str | None:
+    """Register a static system prompt with Gemini's explicit cache and return its kept-alive handle name."""
+    key = (model_name, system_prompt)
+    entry = _prompt_cache_handles.get(key)
+    if entry is not None and time.monotonic() < entry[1]:
+        return entry[0]
+    try:
+        from google import genai
+        from google.genai import types
+
+        client = genai.Client(vertexai=True)
+        cached = client.caches.create(
+            model=model_name,
+            config=types.CreateCachedContentConfig(system_instruction=system_prompt, ttl=f"{_PROMPT_CACHE_TTL}s"),
+        )
+    except Exception:
+        # Prompt caching is an optimization only; any failure falls back to inline prompts.
+        return None
+    _prompt_cache_handles[key] = (cached.name, time.monotonic() + _PROMPT_CACHE_TTL)
+    _schedule_prompt_cache_refresh(key, cached.name)
+    return cached.name
+
+
 def create_fib_agent(
     model: str | BaseChatModel | ModelStrategy = "gemini-2.5-flash",
     include_internet_search: bool = True,
     configure_auth: bool = True,
+    response_cache: SemanticCache | None = None,
+    use_prompt_cache: bool = False,
 ):
     """
     Factory function to create a FIB agent with configurable model.
@@ -413,30 +586,55 @@ def create_fib_agent(
             - A ModelStrategy instance
         include_internet_search: Whether to include the internet search tool.
         configure_auth: Whether to configure OAuth on agent creation.
+        response_cache: Optional SemanticCache; when given, the agent is wrapped so
+            repeated or near-identical single-turn queries return the cached response.
+        use_prompt_cache: Register the (multi-KB) system prompt with Gemini's explicit
+            context cache so each turn references a handle instead of resending it.
+            Only applies to Gemini models addressed by name.
 
     Returns:
         A configured agent graph ready for invocation.
     """
+    # Deferred: importing deepagents pulls in the whole LangChain/LangGraph stack.
+    from deepagents import create_deep_agent
+
     if configure_auth:
         configure_oauth()
 
-    if isinstance(model, ModelStrategy):
-        strategy = model
-    else:
-        strategy = create_model_strategy(model)
-
-    resolved_model = strategy.get_model()
-
-    tools = PRIVATE_TOOLS.copy()
-    if include_internet_search:
-        tools.append(internet_search)
-
-    return create_deep_agent(
+    resolved_model = _resolve_model(model)
+
+    tools = _PRIVATE_TOOLS_WITH_SEARCH if include_internet_search else _PRIVATE_TOOLS_TUPLE
+
+    system_prompt = _get_formatted_system_prompt()
+    subagent_spec = None
+    if use_prompt_cache and isinstance(resolved_model, str):
+        handle = _create_prompt_cache(resolved_model, system_prompt)
+        if handle is not None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            # The subagent gets its own handle so its prompt is cached too; its spec is
+            # built from the model name before the root model is wrapped below.
+            subagent_spec = _public_subagent_spec(resolved_model, _create_prompt_cache(resolved_model, PUBLIC_FIB_SYSTEM_PROMPT))
+            # The handle names a Vertex cachedContents resource, so the consuming model
+            # must target Vertex as well; the cache also carries the system instruction,
+            # and Gemini rejects sending it inline too.
+            resolved_model = ChatGoogleGenerativeAI(model=resolved_model, vertexai=True, location="global", cached_content=handle)
+            system_prompt = None
+    if subagent_spec is None:
+        subagent_spec = _public_subagent_spec(resolved_model)
+
+    agent = create_deep_agent(
         tools=tools,
-        subagents=[PUBLIC_FIB_SUBAGENT],
-        system_prompt=_get_formatted_system_prompt(),
+        subagents=[subagent_spec],
+        system_prompt=system_prompt,
         model=resolved_model,
+        middleware=[ToolConcurrencyMiddleware()],
     )
+    if response_cache is not None:
+        model_name = resolved_model if isinstance(resolved_model, str) else type(resolved_model).__name__
+        tool_names = tuple(getattr(t, "name", getattr(t, "__name__", str(t))) for t in tools)
+        return CachedAgent(agent, response_cache, exact_cache=ExactDiskCache(), model=model_name, tools=tool_names)
+    return agent
 
 
 def get_default_agent():
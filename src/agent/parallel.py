@@ -0,0 +1,50 @@
+"""
+Tool-call concurrency control for the FIB agent.
+
+langgraph's ToolNode already dispatches the tool calls of a turn in parallel
+(a thread executor in the sync path, asyncio.gather in the async path), so
+multi-tool turns like get_my_schedule + get_my_notices overlap their HTTP
+round-trips out of the box. What is missing is a bound: a wide fan-out can
+exhaust the FIB API client's connection pool or trip its rate limit. This
+middleware caps how many tool bodies run at once.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+
+# Subagent dispatch runs a nested tool loop; holding a slot across it risks deadlock.
+SEQUENTIAL_TOOLS = frozenset({"task"})
+
+
+class ToolConcurrencyMiddleware(AgentMiddleware):
+    """Bounds how many tool calls execute concurrently within one agent."""
+
+    def __init__(self, max_concurrency: int | None = None):
+        super().__init__()
+        self._limit = max_concurrency or int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4"))
+        self._semaphore = threading.BoundedSemaphore(self._limit)
+        self._async_semaphores: dict[int, asyncio.Semaphore] = {}
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        # One semaphore per event loop; the threading semaphore would block the loop itself.
+        loop_id = id(asyncio.get_running_loop())
+        semaphore = self._async_semaphores.get(loop_id)
+        if semaphore is None:
+            semaphore = self._async_semaphores.setdefault(loop_id, asyncio.Semaphore(self._limit))
+        return semaphore
+
+    def wrap_tool_call(self, request: Any, handler: Any) -> Any:
+        if request.tool_call["name"] in SEQUENTIAL_TOOLS:
+            return handler(request)
+        with self._semaphore:
+            return handler(request)
+
+    async def awrap_tool_call(self, request: Any, handler: Any) -> Any:
+        if request.tool_call["name"] in SEQUENTIAL_TOOLS:
+            return await handler(request)
+        async with self._async_semaphore():
+            return await handler(request)
@@ -2,12 +2,22 @@
 FIB API HTTP client with authentication, pagination, and error handling.
 """
 
+import asyncio
+import hashlib
 import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from typing import Any, TypeVar
+from urllib.parse import urlparse
 
+import httpx
+import orjson
 import requests
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from requests.adapters import HTTPAdapter
 
 from src.models import (
     AcademicTerm,
@@ -71,6 +81,11 @@ class FIBAPIClient:
 
     BASE_URL = "https://api.fib.upc.edu/v2"
 
+    # TTLs for endpoints whose data is effectively static within a session.
+    PROFILE_CACHE_TTL = 1800.0
+    TERMS_CACHE_TTL = 1800.0
+    NEWS_CACHE_TTL = 300.0
+
     def __init__(
         self,
         client_id: str | None = None,
@@ -84,11 +99,19 @@ class FIBAPIClient:
         self.timeout = timeout
         self._session = requests.Session()
         self._session.headers.update(self._default_headers)
+        # Sized so parallel tool execution can reuse pooled connections instead of
+        # paying a TCP+TLS handshake per request.
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self._aclient: httpx.AsyncClient | None = None
         self._oauth_client = None
+        # key -> (fetched_at, value) for the TTL-cached endpoints below
+        self._response_cache: dict[str, tuple[float, Any]] = {}
 
     def set_oauth_client(self, oauth_client: Any) -> None:
         """Set the OAuth client for authenticated requests."""
         self._oauth_client = oauth_client
+        # A new identity invalidates anything cached under the old token.
+        self._response_cache.clear()
 
     @property
     def is_authenticated(self) -> bool:
@@ -117,22 +140,35 @@ class FIBAPIClient:
             "Accept-Language": self.language,
         }
 
+    # Dispatch table for the rare error path; the common case is a 2xx response.
+    _ERRORS_BY_STATUS = {
+        401: (FIBAuthenticationError, "Invalid credentials"),
+        404: (FIBNotFoundError, "Resource not found"),
+        429: (FIBRateLimitError, "Rate limit exceeded"),
+    }
+
     def _handle_response(self, response: requests.Response) -> dict[str, Any]:
-        if response.status_code == 401:
-            raise FIBAuthenticationError("Invalid credentials", status_code=401)
-        if response.status_code == 404:
-            raise FIBNotFoundError("Resource not found", status_code=404)
-        if response.status_code == 429:
-            raise FIBRateLimitError("Rate limit exceeded", status_code=429)
-        if response.status_code >= 400:
-            raise FIBAPIError(f"API error: {response.text}", status_code=response.status_code)
-        return response.json()
+        status_code = response.status_code
+        if status_code < 400:
+            # orjson parses the raw bytes several times faster than response.json().
+            return orjson.loads(response.content)
+        error_class, message = self._ERRORS_BY_STATUS.get(status_code, (None, None))
+        if error_class is None:
+            raise FIBAPIError(f"API error: {response.text}", status_code=status_code)
+        raise error_class(message, status_code=status_code)
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{self.BASE_URL}/{endpoint}"
         response = self._session.get(url, params=params, timeout=self.timeout)
         return self._handle_response(response)
 
+    def _get_raw(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> bytes:
+        """GET returning the raw body so list responses can be parsed and validated in one pass."""
+        response = self._session.get(url, headers=headers, params=params, timeout=self.timeout)
+        if response.status_code >= 400:
+            self._handle_response(response)
+        return response.content
+
     def _get_authenticated(
         self,
         endpoint: str,
@@ -140,10 +176,89 @@ class FIBAPIClient:
     ) -> dict[str, Any]:
         """Make an authenticated GET request to a private endpoint."""
         url = f"{self.BASE_URL}/{endpoint}"
-        headers = self._get_auth_headers()
-        response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+        # Per-request headers are merged on top of the session-level client_id headers.
+        response = self._session.get(url, headers=self._get_auth_headers(), params=params, timeout=self.timeout)
         return self._handle_response(response)
 
+    _PAGE_POOL_WORKERS = 8
+
+    # One TypeAdapter per model class; validating the whole list in a single
+    # pydantic-core call avoids per-item Python dispatch.
+    _LIST_ADAPTERS: dict[type, TypeAdapter] = {}
+
+    @classmethod
+    def _list_adapter(cls, model_class: type[T]) -> TypeAdapter:
+        adapter = cls._LIST_ADAPTERS.get(model_class)
+        if adapter is None:
+            adapter = cls._LIST_ADAPTERS.setdefault(model_class, TypeAdapter(list[model_class]))
+        return adapter
+
+    def _fetch_remaining_pages(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        first_page: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch pages 2..N concurrently when the first DRF page reports a total count.
+
+        Returns None when the page count cannot be inferred, so callers can fall
+        back to walking the next links serially.
+        """
+        if not first_page.get("next"):
+            return []
+
+        count = first_page.get("count")
+        page_size = len(first_page.get("results", []))
+        if not count or not page_size:
+            return None
+        last_page = -(-count // page_size)
+
+        def fetch_page(page: int) -> list[dict[str, Any]]:
+            page_params = {**(params or {}), "page": page}
+            response = self._session.get(url, headers=headers, params=page_params, timeout=self.timeout)
+            return self._handle_response(response).get("results", [])
+
+        # count is known here, so the list can be presized instead of regrowing per page.
+        remaining: list[dict[str, Any]] = [None] * (count - page_size)
+        index = 0
+        with ThreadPoolExecutor(max_workers=self._PAGE_POOL_WORKERS) as pool:
+            # map preserves page order, so results stay in API order.
+            for page in pool.map(fetch_page, range(2, last_page + 1)):
+                remaining[index : index + len(page)] = page
+                index += len(page)
+        del remaining[index:]
+        return remaining
+
+    @staticmethod
+    def _next_link_params(next_url: str, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Re-forward the original query params when a next link does not echo them.
+
+        Some DRF deployments emit bare next URLs; following those without the
+        filters would silently page through the whole unfiltered catalog.
+        """
+        return params if params and not urlparse(next_url).query else None
+
+    def _walk_next_links(
+        self,
+        first_page: dict[str, Any],
+        model_class: type[T],
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[T]:
+        """Serial pagination fallback for endpoints that don't report a total count."""
+        adapter = self._list_adapter(model_class)
+        all_results = adapter.validate_python(first_page.get("results", []))
+        url = first_page.get("next")
+
+        while url:
+            response = self._session.get(url, headers=headers, params=self._next_link_params(url, params), timeout=self.timeout)
+            data = self._handle_response(response)
+            all_results.extend(adapter.validate_python(data.get("results", [])))
+            url = data.get("next")
+
+        return all_results
+
     def _get_authenticated_list(
         self,
         endpoint: str,
@@ -151,28 +266,59 @@ class FIBAPIClient:
         params: dict[str, Any] | None = None,
     ) -> list[T]:
         """Fetch a list from an authenticated endpoint with pagination support."""
-        all_results: list[T] = []
         url = f"{self.BASE_URL}/{endpoint}"
         headers = self._get_auth_headers()
+        content = self._get_raw(url, params=params, headers=headers)
 
-        while url:
-            response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
-            data = self._handle_response(response)
+        if content[:1] == b"[":
+            return self._list_adapter(model_class).validate_json(content)
+        data = orjson.loads(content)
+        if "results" not in data:
+            return [model_class.model_validate(data)]
 
-            if isinstance(data, list):
-                all_results.extend([model_class.model_validate(item) for item in data])
-                break
+        remaining = self._fetch_remaining_pages(url, params, data, headers=headers)
+        if remaining is None:
+            return self._walk_next_links(data, model_class, headers=headers, params=params)
+        return self._list_adapter(model_class).validate_python([*data.get("results", []), *remaining])
 
-            if "results" in data:
-                results = data.get("results", [])
-                all_results.extend([model_class.model_validate(item) for item in results])
-                url = data.get("next")
-            else:
-                all_results.append(model_class.model_validate(data))
-                break
-            params = None
+    def _iter_paginated(
+        self,
+        endpoint: str,
+        model_class: type[T],
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[T]:
+        """Stream a paginated public endpoint page by page.
 
-        return all_results
+        The first page's items are yielded after a single round-trip, so callers
+        that stop early (or only need the head of a listing) never pull the tail
+        pages through _fetch_remaining_pages.
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        content = self._get_raw(url, params=params)
+
+        adapter = self._list_adapter(model_class)
+        if content[:1] == b"[":
+            # validate_json parses and constructs the models in one pydantic-core pass,
+            # skipping the intermediate Python dicts entirely.
+            yield from adapter.validate_json(content)
+            return
+        data = orjson.loads(content)
+
+        yield from adapter.validate_python(data.get("results", []))
+        if not data.get("next"):
+            return
+
+        remaining = self._fetch_remaining_pages(url, params, data)
+        if remaining is not None:
+            yield from adapter.validate_python(remaining)
+            return
+
+        next_url = data.get("next")
+        while next_url:
+            response = self._session.get(next_url, params=self._next_link_params(next_url, params), timeout=self.timeout)
+            page = self._handle_response(response)
+            yield from adapter.validate_python(page.get("results", []))
+            next_url = page.get("next")
 
     def _get_paginated(
         self,
@@ -180,24 +326,136 @@ class FIBAPIClient:
         model_class: type[T],
         params: dict[str, Any] | None = None,
     ) -> list[T]:
-        all_results: list[T] = []
-        url = f"{self.BASE_URL}/{endpoint}"
+        return list(self._iter_paginated(endpoint, model_class, params=params))
+
+    def _token_key(self) -> str:
+        """Hash of the current OAuth token, so cached private data never crosses users."""
+        token = self._oauth_client.access_token if self._oauth_client else ""
+        return hashlib.sha256(str(token).encode()).hexdigest()
+
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        entry = self._response_cache.get(key)
+        if entry is not None and now - entry[0] <= ttl:
+            return entry[1]
+        value = fetch()
+        self._response_cache[key] = (now, value)
+        return value
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Lazily create the shared async client; HTTP/2 multiplexes concurrent calls on one socket."""
+        if self._aclient is None or self._aclient.is_closed:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                headers=self._default_headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20),
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client if it was opened."""
+        if self._aclient is not None and not self._aclient.is_closed:
+            await self._aclient.aclose()
+
+    async def _aget(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        response = await self._get_aclient().get(f"{self.BASE_URL}/{endpoint}", params=params)
+        return self._handle_response(response)
+
+    async def _aget_authenticated(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make an authenticated async GET request to a private endpoint."""
+        response = await self._get_aclient().get(f"{self.BASE_URL}/{endpoint}", headers=self._get_auth_headers(), params=params)
+        return self._handle_response(response)
+
+    async def _afetch_remaining_pages(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        first_page: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Async mirror of _fetch_remaining_pages using asyncio.gather instead of a thread pool."""
+        if not first_page.get("next"):
+            return []
+
+        count = first_page.get("count")
+        page_size = len(first_page.get("results", []))
+        if not count or not page_size:
+            return None
+        last_page = -(-count // page_size)
+        client = self._get_aclient()
+
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            response = await client.get(url, headers=headers, params={**(params or {}), "page": page})
+            return self._handle_response(response).get("results", [])
+
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+        # count is known here, so the list can be presized instead of regrowing per page.
+        remaining: list[dict[str, Any]] = [None] * (count - page_size)
+        index = 0
+        for page in pages:
+            remaining[index : index + len(page)] = page
+            index += len(page)
+        del remaining[index:]
+        return remaining
+
+    async def _awalk_next_links(
+        self,
+        first_page: dict[str, Any],
+        model_class: type[T],
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[T]:
+        """Async serial pagination fallback for endpoints that don't report a total count."""
+        adapter = self._list_adapter(model_class)
+        all_results = adapter.validate_python(first_page.get("results", []))
+        url = first_page.get("next")
 
         while url:
-            response = self._session.get(url, params=params, timeout=self.timeout)
+            response = await self._get_aclient().get(url, headers=headers, params=self._next_link_params(url, params))
             data = self._handle_response(response)
+            all_results.extend(adapter.validate_python(data.get("results", [])))
+            url = data.get("next")
 
-            if isinstance(data, list):
-                all_results.extend([model_class.model_validate(item) for item in data])
-                break
+        return all_results
 
-            results = data.get("results", [])
-            all_results.extend([model_class.model_validate(item) for item in results])
+    async def _aget_paginated(
+        self,
+        endpoint: str,
+        model_class: type[T],
+        params: dict[str, Any] | None = None,
+    ) -> list[T]:
+        url = f"{self.BASE_URL}/{endpoint}"
+        data = await self._aget(endpoint, params=params)
 
-            url = data.get("next")
-            params = None
+        if isinstance(data, list):
+            return self._list_adapter(model_class).validate_python(data)
 
-        return all_results
+        remaining = await self._afetch_remaining_pages(url, params, data)
+        if remaining is None:
+            return await self._awalk_next_links(data, model_class, params=params)
+        return self._list_adapter(model_class).validate_python([*data.get("results", []), *remaining])
+
+    async def _aget_authenticated_list(
+        self,
+        endpoint: str,
+        model_class: type[T],
+        params: dict[str, Any] | None = None,
+    ) -> list[T]:
+        """Async mirror of _get_authenticated_list."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        headers = self._get_auth_headers()
+        data = await self._aget_authenticated(endpoint, params=params)
+
+        if isinstance(data, list):
+            return self._list_adapter(model_class).validate_python(data)
+        if "results" not in data:
+            return [model_class.model_validate(data)]
+
+        remaining = await self._afetch_remaining_pages(url, params, data, headers=headers)
+        if remaining is None:
+            return await self._awalk_next_links(data, model_class, headers=headers, params=params)
+        return self._list_adapter(model_class).validate_python([*data.get("results", []), *remaining])
 
     # Public endpoints
 
@@ -223,19 +481,51 @@ class FIBAPIClient:
         return self._get_paginated("aules", Classroom)
 
     def get_academic_terms(self) -> list[AcademicTerm]:
-        """Fetch all academic terms/semesters."""
-        return self._get_paginated("quadrimestres", AcademicTerm)
+        """Fetch all academic terms/semesters (cached; the calendar doesn't change mid-session)."""
+        return self._cached("terms", self.TERMS_CACHE_TTL, lambda: self._get_paginated("quadrimestres", AcademicTerm))
 
     def get_news(self) -> list[NewsItem]:
-        """Fetch news and announcements."""
-        return self._get_paginated("noticies", NewsItem)
+        """Fetch news and announcements (cached for a few minutes)."""
+        return self._cached("news", self.NEWS_CACHE_TTL, lambda: self._get_paginated("noticies", NewsItem))
+
+    async def aget_courses(self) -> list[Course]:
+        """Async variant of get_courses."""
+        return await self._aget_paginated("assignatures", Course)
+
+    async def aget_course(self, course_id: str) -> Course:
+        """Async variant of get_course."""
+        data = await self._aget(f"assignatures/{course_id}")
+        return Course.model_validate(data)
+
+    async def aget_exams(self) -> list[Exam]:
+        """Async variant of get_exams."""
+        return await self._aget_paginated("examens", Exam)
+
+    async def aget_professors(self) -> list[Professor]:
+        """Async variant of get_professors."""
+        return await self._aget_paginated("professors", Professor)
+
+    async def aget_classrooms(self) -> list[Classroom]:
+        """Async variant of get_classrooms."""
+        return await self._aget_paginated("aules", Classroom)
+
+    async def aget_academic_terms(self) -> list[AcademicTerm]:
+        """Async variant of get_academic_terms."""
+        return await self._aget_paginated("quadrimestres", AcademicTerm)
+
+    async def aget_news(self) -> list[NewsItem]:
+        """Async variant of get_news."""
+        return await self._aget_paginated("noticies", NewsItem)
 
     # Private endpoints (require OAuth)
 
     def get_my_profile(self) -> UserProfile:
-        """Fetch the authenticated user's profile."""
-        data = self._get_authenticated("jo")
-        return UserProfile.model_validate(data)
+        """Fetch the authenticated user's profile (cached per OAuth token)."""
+        return self._cached(
+            f"profile:{self._token_key()}",
+            self.PROFILE_CACHE_TTL,
+            lambda: UserProfile.model_validate(self._get_authenticated("jo")),
+        )
 
     def get_my_courses(self) -> list[UserCourse]:
         """Fetch the authenticated user's enrolled courses."""
@@ -249,25 +539,54 @@ class FIBAPIClient:
         """Fetch the authenticated user's notices/announcements."""
         return self._get_authenticated_list("jo/avisos", UserNotice)
 
+    async def aget_my_profile(self) -> UserProfile:
+        """Async variant of get_my_profile."""
+        data = await self._aget_authenticated("jo")
+        return UserProfile.model_validate(data)
+
+    async def aget_my_courses(self) -> list[UserCourse]:
+        """Async variant of get_my_courses."""
+        return await self._aget_authenticated_list("jo/assignatures", UserCourse)
+
+    async def aget_my_classes(self) -> list[UserClass]:
+        """Async variant of get_my_classes."""
+        return await self._aget_authenticated_list("jo/classes", UserClass)
+
+    async def aget_my_notices(self) -> list[UserNotice]:
+        """Async variant of get_my_notices."""
+        return await self._aget_authenticated_list("jo/avisos", UserNotice)
+
+
+# Context-local rather than a module global: concurrent tool workers each get
+# their own client (and keep-alive connections) instead of contending on one
+# shared requests.Session.
+_client_var: ContextVar[FIBAPIClient | None] = ContextVar("fib_client", default=None)
 
-_client_instance: FIBAPIClient | None = None
+# Last OAuth client handed to configure_oauth; attached to clients created in
+# fresh contexts so worker threads keep access to private endpoints.
+_configured_oauth: Any | None = None
 
 
 def get_fib_client() -> FIBAPIClient:
-    """Get or create a singleton FIB API client instance."""
-    global _client_instance
-    if _client_instance is None:
-        _client_instance = FIBAPIClient()
-    return _client_instance
+    """Get or create the context-local FIB API client instance."""
+    client = _client_var.get()
+    if client is None:
+        client = FIBAPIClient()
+        if _configured_oauth is not None:
+            client.set_oauth_client(_configured_oauth)
+        _client_var.set(client)
+    return client
 
 
 def configure_oauth() -> bool:
     """Configure OAuth for the FIB client if credentials are available."""
+    global _configured_oauth
     from src.auth import get_oauth_client
 
     client = get_fib_client()
     oauth = get_oauth_client()
     if oauth:
+        _configured_oauth = oauth
         client.set_oauth_client(oauth)
         return True
     return False
@@ -5,35 +5,37 @@ Handles token management, refresh, and authorization flow for accessing
 user-specific data like courses, schedule, and notices.
 """
 
-import json
 import os
 import time
 import webbrowser
 from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from threading import Thread
+from threading import Lock, Thread
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OAuthToken:
     """OAuth2 token with expiration tracking."""
 
     access_token: str
     refresh_token: str
-    expires_at: float
+    expires_at: int
     token_type: str = "Bearer"
 
     @property
     def is_expired(self) -> bool:
-        return time.time() >= self.expires_at - 60
+        # Integer compare; checked before every authenticated request.
+        return int(time.time()) >= self.expires_at - 60
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -45,12 +47,12 @@ class OAuthToken:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "OAuthToken":
-        return cls(
-            access_token=data["access_token"],
-            refresh_token=data["refresh_token"],
-            expires_at=data["expires_at"],
-            token_type=data.get("token_type", "Bearer"),
-        )
+        access_token = data.get("access_token")
+        refresh_token = data.get("refresh_token")
+        expires_at = data.get("expires_at")
+        if access_token is None or refresh_token is None or expires_at is None:
+            raise KeyError("token file is missing required fields")
+        return cls(access_token, refresh_token, int(expires_at), data.get("token_type", "Bearer"))
 
 
 class FIBOAuthError(Exception):
@@ -89,6 +91,12 @@ class FIBOAuthClient:
 
         self._token: OAuthToken | None = None
         self._token_file = Path(token_file) if token_file else Path.home() / ".fib_token.json"
+        # Reused across token exchanges/refreshes to keep the TLS connection warm.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        # Coalesces concurrent refreshes; a duplicate refresh POST can invalidate
+        # the refresh token server-side.
+        self._refresh_lock = Lock()
         self._load_token()
 
     @property
@@ -97,10 +105,15 @@ class FIBOAuthClient:
 
     @property
     def access_token(self) -> str | None:
-        if self._token is None:
+        token = self._token
+        if token is None:
             return None
-        if self._token.is_expired:
-            self._refresh_token()
+        # Double-checked locking: the common non-expired path takes no lock, and
+        # under contention only one thread performs the refresh.
+        if token.is_expired:
+            with self._refresh_lock:
+                if self._token is not None and self._token.is_expired:
+                    self._refresh_token()
         return self._token.access_token if self._token else None
 
     def get_authorization_url(self, scopes: list[str] | None = None) -> str:
@@ -167,7 +180,7 @@ class FIBOAuthClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.TOKEN_URL,
                 data=data,
                 auth=(self.client_id, self.client_secret),
@@ -177,12 +190,12 @@ class FIBOAuthClient:
                 print(f"Token exchange failed: {response.status_code}")
                 print(f"Response: {response.text}")
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
 
             self._token = OAuthToken(
                 access_token=token_data["access_token"],
                 refresh_token=token_data.get("refresh_token", ""),
-                expires_at=time.time() + token_data.get("expires_in", 3600),
+                expires_at=int(time.time()) + int(token_data.get("expires_in", 3600)),
                 token_type=token_data.get("token_type", "Bearer"),
             )
             self._save_token()
@@ -202,19 +215,19 @@ class FIBOAuthClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.TOKEN_URL,
                 data=data,
                 auth=(self.client_id, self.client_secret),
                 timeout=30,
             )
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
 
             self._token = OAuthToken(
                 access_token=token_data["access_token"],
                 refresh_token=token_data.get("refresh_token", self._token.refresh_token),
-                expires_at=time.time() + token_data.get("expires_in", 3600),
+                expires_at=int(time.time()) + int(token_data.get("expires_in", 3600)),
                 token_type=token_data.get("token_type", "Bearer"),
             )
             self._save_token()
@@ -224,31 +237,33 @@ class FIBOAuthClient:
 
     def _load_token(self) -> None:
         """Load token from file if exists."""
-        if self._token_file.exists():
-            try:
-                with open(self._token_file) as f:
-                    data = json.load(f)
-                self._token = OAuthToken.from_dict(data)
-                if self._token.is_expired and self._token.refresh_token:
-                    self._refresh_token()
-            except (json.JSONDecodeError, KeyError):
-                self._token = None
+        try:
+            data = orjson.loads(self._token_file.read_bytes())
+            self._token = OAuthToken.from_dict(data)
+            if self._token.is_expired and self._token.refresh_token:
+                self._refresh_token()
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, KeyError):
+            self._token = None
 
     def _save_token(self) -> None:
         """Save token to file."""
         if self._token:
-            with open(self._token_file, "w") as f:
-                json.dump(self._token.to_dict(), f)
+            self._token_file.write_bytes(orjson.dumps(self._token.to_dict()))
 
     def _clear_token(self) -> None:
         """Clear saved token."""
-        if self._token_file.exists():
-            self._token_file.unlink()
+        self._token_file.unlink(missing_ok=True)
 
     def logout(self) -> None:
-        """Clear authentication state."""
+        """Clear authentication state and any personal data cached at the tool layer."""
         self._token = None
         self._clear_token()
+        # Deferred: keeps the auth package importable without the tools stack.
+        from src.tools.private import invalidate_private_cache
+
+        invalidate_private_cache()
 
 
 _oauth_client: FIBOAuthClient | None = None
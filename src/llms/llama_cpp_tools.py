@@ -5,11 +5,10 @@ This module provides a LangChain-compatible chat model that uses llama-cpp-pytho
 and implements tool calling via Qwen's XML-based format.
 """
 
-import json
-import re
 from collections.abc import Iterator, Sequence
 from typing import Any, Optional
 
+import orjson
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models import BaseChatModel, LanguageModelInput
 from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, SystemMessage, ToolMessage
@@ -17,7 +16,24 @@ from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResu
 from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from langchain_core.utils.function_calling import convert_to_openai_tool
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr
+
+_TOOL_CALL_OPEN = "<tool_call>"
+_TOOL_CALL_CLOSE = "</tool_call>"
+
+# id(tool) -> (tool, schema); keeping the tool referenced pins its id so
+# entries can never go stale through id reuse.
+_TOOL_SCHEMA_CACHE: dict[int, tuple[Any, dict]] = {}
+
+
+def _openai_tool_schema(tool: Any) -> dict:
+    """Convert a tool to its OpenAI schema once; rebinding the same tools is free."""
+    key = id(tool)
+    entry = _TOOL_SCHEMA_CACHE.get(key)
+    if entry is None:
+        entry = _TOOL_SCHEMA_CACHE.setdefault(key, (tool, convert_to_openai_tool(tool)))
+    return entry[1]
+
 
 TOOL_SYSTEM_PROMPT_TEMPLATE = """{system_prompt}
 
@@ -49,23 +65,25 @@ class ChatLlamaCppTools(BaseChatModel):
     verbose: bool = False
     tools: list[dict] = Field(default_factory=list)
 
-    @model_validator(mode="after")
-    def validate_environment(self) -> "ChatLlamaCppTools":
-        if self.client is not None:
-            return self
-
-        try:
-            from llama_cpp import Llama
-        except ImportError as e:
-            raise ImportError("llama-cpp-python is required. Install with: pip install llama-cpp-python") from e
+    # Serialized tool block and the no-custom-system prompt, fixed once tools are bound.
+    _tools_json: str | None = PrivateAttr(default=None)
+    _default_tool_system: str | None = PrivateAttr(default=None)
 
-        self.client = Llama(
-            model_path=self.model_path,
-            n_ctx=self.n_ctx,
-            n_gpu_layers=self.n_gpu_layers,
-            verbose=self.verbose,
-        )
-        return self
+    def _ensure_client(self) -> Any:
+        """Load the llama.cpp model on first use, keeping import and model load off the constructor."""
+        if self.client is None:
+            try:
+                from llama_cpp import Llama
+            except ImportError as e:
+                raise ImportError("llama-cpp-python is required. Install with: pip install llama-cpp-python") from e
+
+            self.client = Llama(
+                model_path=self.model_path,
+                n_ctx=self.n_ctx,
+                n_gpu_layers=self.n_gpu_layers,
+                verbose=self.verbose,
+            )
+        return self.client
 
     def close(self) -> None:
         """Release model resources."""
@@ -91,8 +109,9 @@ class ChatLlamaCppTools(BaseChatModel):
         tools: Sequence[BaseTool | dict],
         **kwargs: Any,
     ) -> Runnable[LanguageModelInput, BaseMessage]:
-        formatted_tools = [convert_to_openai_tool(tool) if not isinstance(tool, dict) else tool for tool in tools]
-        return self.__class__(
+        formatted_tools = [_openai_tool_schema(tool) if not isinstance(tool, dict) else tool for tool in tools]
+        # model_construct skips pydantic validation: every field here is already validated.
+        bound = self.__class__.model_construct(
             model_path=self.model_path,
             n_ctx=self.n_ctx,
             n_gpu_layers=self.n_gpu_layers,
@@ -103,6 +122,12 @@ class ChatLlamaCppTools(BaseChatModel):
             tools=formatted_tools,
             client=self.client,
         )
+        bound._tools_json = "\n".join(orjson.dumps(tool).decode() for tool in formatted_tools)
+        bound._default_tool_system = TOOL_SYSTEM_PROMPT_TEMPLATE.format(
+            system_prompt="You are a helpful assistant.",
+            tools_json=bound._tools_json,
+        )
+        return bound
 
     def _format_messages(self, messages: list[BaseMessage]) -> list[dict]:
         formatted = []
@@ -118,44 +143,61 @@ class ChatLlamaCppTools(BaseChatModel):
                 if msg.tool_calls:
                     tool_calls_xml = ""
                     for tc in msg.tool_calls:
-                        tool_calls_xml += f'\n<tool_call>\n{{"name": "{tc["name"]}", "arguments": {json.dumps(tc["args"])}}}\n</tool_call>'
+                        tool_calls_xml += f'\n<tool_call>\n{{"name": "{tc["name"]}", "arguments": {orjson.dumps(tc["args"]).decode()}}}\n</tool_call>'
                     content = content + tool_calls_xml if content else tool_calls_xml.strip()
                 formatted.append({"role": "assistant", "content": content})
             elif isinstance(msg, ToolMessage):
                 formatted.append({"role": "user", "content": f"<tool_response>\n{msg.content}\n</tool_response>"})
 
         if self.tools:
-            tools_json = "\n".join(json.dumps(tool) for tool in self.tools)
-            system_with_tools = TOOL_SYSTEM_PROMPT_TEMPLATE.format(
-                system_prompt=system_content or "You are a helpful assistant.",
-                tools_json=tools_json,
-            )
-            formatted.insert(0, {"role": "system", "content": system_with_tools})
+            if not system_content and self._default_tool_system is not None:
+                system_message = self._default_tool_system
+            else:
+                if self._tools_json is None:
+                    self._tools_json = "\n".join(orjson.dumps(tool).decode() for tool in self.tools)
+                system_message = TOOL_SYSTEM_PROMPT_TEMPLATE.format(
+                    system_prompt=system_content or "You are a helpful assistant.",
+                    tools_json=self._tools_json,
+                )
         elif system_content:
-            formatted.insert(0, {"role": "system", "content": system_content})
+            system_message = system_content
+        else:
+            return formatted
 
-        return formatted
+        # Prepend via unpacking: insert(0, ...) shifts the whole history each turn.
+        return [{"role": "system", "content": system_message}, *formatted]
 
     def _parse_tool_calls(self, content: str) -> tuple[str, list[dict]]:
+        # Single linear scan over the output: no regex backtracking, and the
+        # cleaned content is assembled from the slices between tags in the same pass.
         tool_calls = []
-        pattern = r"<tool_call>\s*(\{.*?\})\s*</tool_call>"
-        matches = re.findall(pattern, content, re.DOTALL)
-
-        for i, match in enumerate(matches):
+        cleaned_parts = []
+        pos = 0
+        while True:
+            start = content.find(_TOOL_CALL_OPEN, pos)
+            if start == -1:
+                cleaned_parts.append(content[pos:])
+                break
+            cleaned_parts.append(content[pos:start])
+            end = content.find(_TOOL_CALL_CLOSE, start)
+            if end == -1:
+                # Unterminated tag: keep the tail verbatim rather than guessing.
+                cleaned_parts.append(content[start:])
+                break
             try:
-                parsed = json.loads(match)
+                parsed = orjson.loads(content[start + len(_TOOL_CALL_OPEN) : end].strip())
+            except orjson.JSONDecodeError:
+                pass
+            else:
                 tool_calls.append(
                     {
-                        "id": f"call_{i}",
+                        "id": f"call_{len(tool_calls)}",
                         "name": parsed.get("name", ""),
                         "args": parsed.get("arguments", {}),
                     }
                 )
-            except json.JSONDecodeError:
-                continue
-
-        cleaned_content = re.sub(pattern, "", content, flags=re.DOTALL).strip()
-        return cleaned_content, tool_calls
+            pos = end + len(_TOOL_CALL_CLOSE)
+        return "".join(cleaned_parts).strip(), tool_calls
 
     def _generate(
         self,
@@ -166,7 +208,7 @@ class ChatLlamaCppTools(BaseChatModel):
     ) -> ChatResult:
         formatted_messages = self._format_messages(messages)
 
-        response = self.client.create_chat_completion(
+        response = self._ensure_client().create_chat_completion(
             messages=formatted_messages,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
@@ -193,7 +235,7 @@ class ChatLlamaCppTools(BaseChatModel):
     ) -> Iterator[ChatGenerationChunk]:
         formatted_messages = self._format_messages(messages)
 
-        response = self.client.create_chat_completion(
+        response = self._ensure_client().create_chat_completion(
             messages=formatted_messages,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
@@ -202,13 +244,18 @@ class ChatLlamaCppTools(BaseChatModel):
             stream=True,
         )
 
-        full_content = ""
+        # Accumulate into a list: repeated str += is quadratic over long completions.
+        chunks: list[str] = []
         for chunk in response:
             if chunk["choices"] and chunk["choices"][0]["delta"].get("content"):
                 delta = chunk["choices"][0]["delta"]["content"]
-                full_content += delta
+                chunks.append(delta)
                 yield ChatGenerationChunk(message=AIMessageChunk(content=delta))
 
+        full_content = "".join(chunks)
+        # memchr-backed substring test; most turns contain no tool calls at all.
+        if _TOOL_CALL_OPEN not in full_content:
+            return
         _, tool_calls = self._parse_tool_calls(full_content)
         if tool_calls:
             yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_calls=tool_calls))
@@ -5,8 +5,11 @@ This module creates an MCP server that exposes all FIB API tools
 for use by MCP-compatible clients and agents.
 """
 
+import asyncio
+import time
+
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
+from mcp.types import ListToolsResult, TextContent, Tool
 
 from mcp.server import Server
 from src.tools import (
@@ -301,21 +304,69 @@ TOOL_HANDLERS = {
 }
 
 
+# Built once: the tool list is static, so every tools/list RPC can return the
+# same prebuilt result instead of re-wrapping (and re-registering) the list.
+_LIST_TOOLS_RESULT = ListToolsResult(tools=TOOL_DEFINITIONS)
+
+
 @server.list_tools()
-async def list_tools() -> list[Tool]:
+async def list_tools() -> ListToolsResult:
     """List all available FIB API tools."""
-    return TOOL_DEFINITIONS
+    return _LIST_TOOLS_RESULT
+
+
+# TTLs for public read-only tools; reference data changes at most daily, search
+# and news a bit faster. get_my_* tools are user-specific and never cached here.
+_CACHE_TTLS = {
+    "search_courses": 60.0,
+    "get_course_details": 60.0,
+    "search_exams": 60.0,
+    "get_upcoming_exams": 60.0,
+    "search_professors": 60.0,
+    "get_fib_news": 60.0,
+    "get_academic_terms": 300.0,
+    "get_current_term": 300.0,
+    "list_classrooms": 300.0,
+}
+
+# (name, sorted arguments) -> (fetched_at, result text)
+_CACHE: dict[tuple, tuple[float, str]] = {}
+
+
+def _make_dispatcher(name: str, handler):
+    """Bind a handler into a closure that formats (and optionally caches) its result."""
+    ttl = _CACHE_TTLS.get(name)
+
+    def dispatch(arguments: dict) -> list[TextContent]:
+        # model_construct skips validation; handlers always return str and type is fixed.
+        if ttl is None:
+            return [TextContent.model_construct(type="text", text=handler(**arguments))]
+        key = (name, tuple(sorted(arguments.items())))
+        now = time.monotonic()
+        hit = _CACHE.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            text = hit[1]
+        else:
+            text = handler(**arguments)
+            _CACHE[key] = (now, text)
+        return [TextContent.model_construct(type="text", text=text)]
+
+    return dispatch
+
+
+# One closure per tool, built at import; call_tool does a single dict lookup.
+_DISPATCH = {name: _make_dispatcher(name, handler) for name, handler in TOOL_HANDLERS.items()}
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Execute a FIB API tool."""
-    if name not in TOOL_HANDLERS:
-        return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-    handler = TOOL_HANDLERS[name]
-    result = handler(**arguments)
-    return [TextContent(type="text", text=result)]
+    dispatch = _DISPATCH.get(name)
+    if dispatch is None:
+        return [TextContent.model_construct(type="text", text=f"Unknown tool: {name}")]
+    # Handlers do blocking HTTP; a worker thread keeps the stdio loop serving
+    # other requests while this one waits on the FIB API.
+    return await asyncio.to_thread(dispatch, arguments)
 
 
 async def run_server():
@@ -5,9 +5,20 @@ These models provide type-safe representations of the FIB API responses,
 enabling better validation, IDE support, and serialization.
 """
 
+import re
+import sys
 from datetime import datetime
+from functools import cached_property
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+# Compiled once; plain_description/plain_text strip tags per item in news loops.
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Low-cardinality codes (plans, types, semesters, departments) repeat across thousands
+# of cached records; interning dedupes them and makes equality a pointer compare.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class PaginatedResponse[T](BaseModel):
@@ -22,9 +33,9 @@ class PaginatedResponse[T](BaseModel):
 class CourseObligatorietat(BaseModel):
     """Course requirement/obligation type within a study plan."""
 
-    codi_oblig: str = Field(description="Obligation code (OBL, OPT, etc.)")
-    codi_especialitat: str = Field(default="", description="Specialization code")
-    pla: str = Field(description="Study plan code")
+    codi_oblig: InternedStr = Field(description="Obligation code (OBL, OPT, etc.)")
+    codi_especialitat: InternedStr = Field(default="", description="Specialization code")
+    pla: InternedStr = Field(description="Study plan code")
     nom_especialitat: str = Field(default="", description="Specialization name")
 
 
@@ -35,14 +46,14 @@ class Course(BaseModel):
     url: str = Field(description="API URL for course details")
     guia: str | None = Field(default=None, description="API URL for course guide")
     obligatorietats: list[CourseObligatorietat] = Field(default_factory=list)
-    plans: list[str] = Field(default_factory=list, description="Study plans offering this course")
+    plans: list[InternedStr] = Field(default_factory=list, description="Study plans offering this course")
     lang: dict[str, list[str]] = Field(default_factory=dict, description="Languages by semester")
-    quadrimestres: list[str] = Field(default_factory=list, description="Semesters when offered (Q1, Q2)")
+    quadrimestres: list[InternedStr] = Field(default_factory=list, description="Semesters when offered (Q1, Q2)")
     sigles: str = Field(description="Course acronym")
     codi_upc: str = Field(description="UPC course code")
-    semestre: str = Field(description="Typical semester (S1-S8)")
+    semestre: InternedStr = Field(description="Typical semester (S1-S8)")
     credits: float = Field(description="ECTS credits")
-    vigent: str = Field(description="Active status (S/N)")
+    vigent: InternedStr = Field(description="Active status (S/N)")
     guia_docent_externa: str = Field(default="")
     nom: str = Field(description="Course name")
     guia_docent_url_publica: str = Field(default="", description="Public syllabus URL")
@@ -56,16 +67,16 @@ class Exam(BaseModel):
     """FIB exam schedule entry."""
 
     id: int = Field(description="Exam entry ID")
-    assig: str = Field(description="Course code")
+    assig: InternedStr = Field(description="Course code")
     codi_upc: str = Field(description="UPC course code")
     aules: str = Field(description="Classroom(s) for the exam")
     inici: datetime = Field(description="Exam start datetime")
     fi: datetime = Field(description="Exam end datetime")
     quatr: int = Field(description="Semester number (1 or 2)")
     curs: int = Field(description="Academic year (e.g., 2023 for 2023-2024)")
-    pla: str = Field(description="Study plan code")
-    tipus: str = Field(description="Exam type (F=Final, P=Partial)")
-    tipus_assignatura: str = Field(default="", description="Course type description")
+    pla: InternedStr = Field(description="Study plan code")
+    tipus: InternedStr = Field(description="Exam type (F=Final, P=Partial)")
+    tipus_assignatura: InternedStr = Field(default="", description="Course type description")
     comentaris: str = Field(default="", description="Additional comments")
     eslaboratori: str = Field(default="", description="Lab indicator")
 
@@ -82,13 +93,13 @@ class Professor(BaseModel):
     """FIB professor/faculty member."""
 
     id: int = Field(description="Professor ID")
-    assignatures: list[str] = Field(default_factory=list, description="Courses taught")
-    plans_estudi: list[str] = Field(default_factory=list, description="Study plans")
-    especialitats: list[str] = Field(default_factory=list, description="Specializations")
+    assignatures: list[InternedStr] = Field(default_factory=list, description="Courses taught")
+    plans_estudi: list[InternedStr] = Field(default_factory=list, description="Study plans")
+    especialitats: list[InternedStr] = Field(default_factory=list, description="Specializations")
     obfuscated_email: str = Field(description="Email with (at) instead of @")
     nom: str = Field(description="First name")
     cognoms: str = Field(description="Last name(s)")
-    departament: str = Field(description="Department code")
+    departament: InternedStr = Field(description="Department code")
     futur_url: str = Field(default="", description="FUTUR research profile URL")
     apren_url: str = Field(default="", description="APREN teaching profile URL")
 
@@ -107,11 +118,11 @@ class Classroom(BaseModel):
     id: str = Field(description="Room identifier")
     reserves: str = Field(description="API URL for room reservations")
 
-    @property
+    @cached_property
     def building(self) -> str:
-        if self.id and len(self.id) > 0 and self.id[0].isalpha():
-            return self.id[0]
-        return ""
+        # Room ids are ASCII; a range compare on the sliced head avoids the Unicode isalpha lookup.
+        letter = self.id[:1]
+        return letter if letter and ("A" <= letter <= "Z" or "a" <= letter <= "z") else ""
 
 
 class AcademicTerm(BaseModel):
@@ -148,10 +159,7 @@ class NewsItem(BaseModel):
 
     @property
     def plain_description(self) -> str:
-        import re
-
-        clean = re.sub(r"<[^>]+>", "", self.descripcio)
-        return clean.strip()
+        return _HTML_TAG_RE.sub("", self.descripcio).strip()
 
 
 # Private endpoint models (require OAuth authentication)
@@ -250,7 +258,4 @@ class UserNotice(BaseModel):
 
     @property
     def plain_text(self) -> str:
-        import re
-
-        clean = re.sub(r"<[^>]+>", "", self.text)
-        return clean.strip()
+        return _HTML_TAG_RE.sub("", self.text).strip()
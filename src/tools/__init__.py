@@ -1,15 +1,19 @@
-from src.tools.academic import get_academic_terms, get_current_term
-from src.tools.base import format_tool_response, handle_api_errors
-from src.tools.classrooms import list_classrooms
-from src.tools.courses import get_course_details, search_courses
-from src.tools.exams import get_upcoming_exams, search_exams
-from src.tools.news import get_fib_news
-from src.tools.private import get_my_courses, get_my_notices, get_my_profile, get_my_schedule
+import asyncio
+
+from src.tools.academic import _load_terms, get_academic_terms, get_current_term
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors
+from src.tools.classrooms import _load_classrooms, list_classrooms
+from src.tools.courses import _load_courses, get_course_details, search_courses
+from src.tools.exams import _load_exams, get_upcoming_exams, search_exams
+from src.tools.news import _load_news, get_fib_news
+from src.tools.private import get_my_courses, get_my_notices, get_my_profile, get_my_schedule, warmup_private
 from src.tools.professors import get_course_professors, search_professors
 
 __all__ = [
     "format_tool_response",
     "handle_api_errors",
+    "warmup",
+    "warmup_private",
     "search_courses",
     "get_course_details",
     "search_exams",
@@ -47,3 +51,20 @@ PRIVATE_FIB_TOOLS = [
     get_my_schedule,
     get_my_notices,
 ]
+
+
+_WARMUP_LOADERS = (
+    ("courses", _load_courses),
+    ("exams", _load_exams),
+    ("classrooms", _load_classrooms),
+    ("terms", _load_terms),
+    ("news", _load_news),
+)
+
+
+async def warmup() -> None:
+    """Prefetch all public collections concurrently so first-turn tool calls hit a warm cache."""
+    await asyncio.gather(
+        *(asyncio.to_thread(cached, key, COLLECTION_CACHE_TTL, loader) for key, loader in _WARMUP_LOADERS),
+        return_exceptions=True,
+    )
@@ -3,7 +3,12 @@ Academic terms and general academic information tools for FIB API.
 """
 
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors
+
+
+def _load_terms() -> list:
+    """Cache loader for academic terms, newest first (shared with warmup)."""
+    return sorted(get_fib_client().get_academic_terms(), key=lambda term: term.id, reverse=True)
 
 
 @handle_api_errors
@@ -18,8 +23,7 @@ def get_academic_terms(current_only: bool = False, year: int | None = None) -> s
     Returns:
         JSON string with academic term information
     """
-    client = get_fib_client()
-    terms = client.get_academic_terms()
+    terms = cached("terms", COLLECTION_CACHE_TTL, _load_terms)
 
     results = []
     for term in terms:
@@ -38,8 +42,6 @@ def get_academic_terms(current_only: bool = False, year: int | None = None) -> s
             }
         )
 
-    results.sort(key=lambda x: x["id"], reverse=True)
-
     if current_only and results:
         return format_tool_response(results[0])
     return format_tool_response(results, f"Found {len(results)} academic term(s)")
@@ -2,12 +2,47 @@
 Base tool utilities and error handling for FIB API tools.
 """
 
-import json
+import os
+import time
 from collections.abc import Callable
+from datetime import date, datetime
 from functools import wraps
 from typing import Any
 
-from src.api import FIBAPIError, FIBAuthenticationError, FIBNotFoundError, FIBRateLimitError
+import orjson
+from pydantic import BaseModel
+
+from src.api import FIBAPIError, FIBAuthenticationError, FIBNotFoundError, FIBOAuthRequiredError, FIBRateLimitError
+
+# endpoint key -> (fetched_at, collection); shared by all tools in this package
+_cache: dict[str, tuple[float, Any]] = {}
+
+COLLECTION_CACHE_TTL = 300.0
+
+
+def cached(key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+    """Load-through TTL cache so repeated tool calls reuse fetched collections."""
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now - entry[0] <= ttl:
+        return entry[1]
+    value = loader()
+    _cache[key] = (now, value)
+    return value
+
+
+# Responses feed an LLM, where indentation only inflates token count and encode
+# time. Set FIB_TOOLS_PRETTY_JSON=1 to get indented output when debugging.
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2 if os.getenv("FIB_TOOLS_PRETTY_JSON") else 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
 
 
 def format_tool_response(data: Any, summary: str | None = None) -> str:
@@ -18,8 +53,36 @@ def format_tool_response(data: Any, summary: str | None = None) -> str:
         result = {"count": len(data), "results": data}
         if summary:
             result["summary"] = summary
-        return json.dumps(result, default=str, ensure_ascii=False, indent=2)
-    return json.dumps(data, default=str, ensure_ascii=False, indent=2)
+        return orjson.dumps(result, default=_json_default, option=_DUMPS_OPTIONS).decode()
+    return orjson.dumps(data, default=_json_default, option=_DUMPS_OPTIONS).decode()
+
+
+# Constant error payloads serialized once at import; only the two variable ones
+# (API error detail, unexpected exception) are rendered at raise time.
+_AUTH_ERROR_RESPONSE = orjson.dumps(
+    {
+        "error": "Authentication failed",
+        "message": "The FIB API credentials are invalid or missing. Please check your configuration.",
+    }
+).decode()
+_NOT_FOUND_RESPONSE = orjson.dumps(
+    {
+        "error": "Not found",
+        "message": "The requested resource was not found in the FIB system.",
+    }
+).decode()
+_RATE_LIMIT_RESPONSE = orjson.dumps(
+    {
+        "error": "Rate limit exceeded",
+        "message": "Too many requests to the FIB API. Please wait a moment and try again.",
+    }
+).decode()
+_OAUTH_REQUIRED_RESPONSE = orjson.dumps(
+    {
+        "error": "Authentication required",
+        "message": "Please log in with your FIB account to access your personal data.",
+    }
+).decode()
 
 
 def handle_api_errors(func: Callable) -> Callable:
@@ -30,40 +93,27 @@ def handle_api_errors(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         except FIBAuthenticationError:
-            return json.dumps(
-                {
-                    "error": "Authentication failed",
-                    "message": "The FIB API credentials are invalid or missing. Please check your configuration.",
-                }
-            )
+            return _AUTH_ERROR_RESPONSE
         except FIBNotFoundError:
-            return json.dumps(
-                {
-                    "error": "Not found",
-                    "message": "The requested resource was not found in the FIB system.",
-                }
-            )
+            return _NOT_FOUND_RESPONSE
         except FIBRateLimitError:
-            return json.dumps(
-                {
-                    "error": "Rate limit exceeded",
-                    "message": "Too many requests to the FIB API. Please wait a moment and try again.",
-                }
-            )
+            return _RATE_LIMIT_RESPONSE
+        except FIBOAuthRequiredError:
+            return _OAUTH_REQUIRED_RESPONSE
         except FIBAPIError as e:
-            return json.dumps(
+            return orjson.dumps(
                 {
                     "error": "API error",
                     "message": f"An error occurred while accessing the FIB API: {e.message}",
                 }
-            )
+            ).decode()
         except Exception as e:
-            return json.dumps(
+            return orjson.dumps(
                 {
                     "error": "Unexpected error",
                     "message": f"An unexpected error occurred: {str(e)}",
                 }
-            )
+            ).decode()
 
     return wrapper
 
@@ -2,8 +2,32 @@
 Classroom tools for FIB API.
 """
 
+from bisect import bisect_left
+
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors
+
+
+def _load_classrooms() -> list:
+    """Cache loader for classrooms, pre-sorted by id (shared with warmup)."""
+    return sorted(get_fib_client().get_classrooms(), key=lambda room: room.id)
+
+
+# Rebuilt only when the cached classroom list is replaced (id-keyed, single entry).
+_prefix_index_cache: dict[int, tuple[object, tuple[list[str], list]]] = {}
+
+
+def _prefix_index(classrooms: list) -> tuple[list[str], list]:
+    """Rooms re-sorted by uppercased id, with a parallel key list for bisect range queries."""
+    entry = _prefix_index_cache.get(id(classrooms))
+    if entry is not None and entry[0] is classrooms:
+        return entry[1]
+
+    rooms = sorted(classrooms, key=lambda room: room.id.upper())
+    index = ([room.id.upper() for room in rooms], rooms)
+    _prefix_index_cache.clear()
+    _prefix_index_cache[id(classrooms)] = (classrooms, index)
+    return index
 
 
 @handle_api_errors
@@ -18,22 +42,29 @@ def list_classrooms(building: str | None = None, prefix: str | None = None) -> s
     Returns:
         JSON string with classroom information
     """
-    client = get_fib_client()
-    classrooms = client.get_classrooms()
+    classrooms = cached("classrooms", COLLECTION_CACHE_TTL, _load_classrooms)
+
+    prefix_upper = prefix.upper() if prefix else None
+    building_upper = building.upper() if building else None
+
+    # A prefix filter (more specific than building) is a contiguous range in
+    # upper-sorted id order, so bisect cuts the candidates instead of scanning.
+    if prefix_upper:
+        ids_upper, rooms = _prefix_index(classrooms)
+        lo = bisect_left(ids_upper, prefix_upper)
+        hi = bisect_left(ids_upper, prefix_upper[:-1] + chr(ord(prefix_upper[-1]) + 1))
+        candidates = sorted(rooms[lo:hi], key=lambda room: room.id)
+    else:
+        candidates = classrooms
 
     results = []
-    for room in classrooms:
+    for room in candidates:
         if room.id == "**":
             continue
 
-        # If prefix is given, filter by prefix (more specific than building)
-        if prefix:
-            if not room.id.upper().startswith(prefix.upper()):
-                continue
-        elif building:
-            # Only apply building filter if prefix is not given
-            if room.building.upper() != building.upper():
-                continue
+        # Only apply the building filter when prefix is not given
+        if prefix_upper is None and building_upper and room.building.upper() != building_upper:
+            continue
 
         results.append(
             {
@@ -42,8 +73,6 @@ def list_classrooms(building: str | None = None, prefix: str | None = None) -> s
             }
         )
 
-    results.sort(key=lambda x: x["id"])
-
     summary = f"Found {len(results)} classroom(s)"
     if prefix:
         summary += f" with prefix '{prefix}'"
@@ -2,10 +2,58 @@
 Course/assignatures tools for FIB API.
 """
 
+from dataclasses import dataclass
 from typing import Literal
 
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors, matches_query
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors, normalize_string
+
+
+def _load_courses() -> list:
+    """Cache loader for the course catalog (shared with warmup)."""
+    return get_fib_client().get_courses()
+
+
+# Rebuilt only when the cached course list is replaced (id-keyed, single entry).
+_index_cache: dict[int, tuple[object, dict]] = {}
+
+
+@dataclass(slots=True)
+class CourseHit:
+    """One search_courses result row; orjson serializes dataclasses natively."""
+
+    id: str
+    name: str
+    credits: float
+    semester: str
+    semesters_offered: list[str]
+    study_plans: list[str]
+    syllabus_url: str
+
+
+def _course_index(courses: list) -> dict:
+    """Index the catalog by plan and requirement type for O(1) exact-filter lookups."""
+    entry = _index_cache.get(id(courses))
+    if entry is not None and entry[0] is courses:
+        return entry[1]
+
+    # One pre-lowercased id/nom haystack per course; NUL keeps matches from spanning fields.
+    haystacks = [f"{normalize_string(course.id)}\0{normalize_string(course.nom)}" for course in courses]
+    by_plan: dict[str, set[int]] = {}
+    by_type: dict[str, set[int]] = {}
+    by_type_plan: dict[tuple[str, str], set[int]] = {}
+    for i, course in enumerate(courses):
+        for plan in course.plans:
+            by_plan.setdefault(plan.upper(), set()).add(i)
+        for req in course.obligatorietats:
+            req_type = req.codi_oblig.upper()
+            by_type.setdefault(req_type, set()).add(i)
+            by_type_plan.setdefault((req_type, req.pla.upper()), set()).add(i)
+
+    index = {"by_plan": by_plan, "by_type": by_type, "by_type_plan": by_type_plan, "haystacks": haystacks}
+    _index_cache.clear()
+    _index_cache[id(courses)] = (courses, index)
+    return index
 
 
 @handle_api_errors
@@ -33,46 +81,46 @@ def search_courses(
     Returns:
         JSON string with matching courses
     """
-    client = get_fib_client()
-    courses = client.get_courses()
+    courses = cached("courses", COLLECTION_CACHE_TTL, _load_courses)
+
+    # Exact-match filters narrow to an indexed candidate set before the scan.
+    index = _course_index(courses)
+    candidates: set[int] | None = None
+    if study_plan and course_type:
+        candidates = index["by_type_plan"].get((course_type.upper(), study_plan.upper()), set())
+    elif study_plan:
+        candidates = index["by_plan"].get(study_plan.upper(), set())
+    elif course_type:
+        candidates = index["by_type"].get(course_type.upper(), set())
+
+    rows = range(len(courses)) if candidates is None else sorted(candidates)
+    needle = normalize_string(query) if query else None
+    haystacks = index["haystacks"]
 
     results = []
-    for course in courses:
+    for i in rows:
+        course = courses[i]
         if active_only and not course.is_active:
             continue
-        if query and not (matches_query(course.id, query) or matches_query(course.nom, query)):
+        if needle and needle not in haystacks[i]:
             continue
         if semester and semester not in course.quadrimestres:
             continue
-        if study_plan and study_plan.upper() not in [p.upper() for p in course.plans]:
-            continue
-
-        # Filter by course type (optionally combined with study_plan)
-        if course_type:
-            type_match = False
-            for req in course.obligatorietats:
-                if req.codi_oblig.upper() == course_type.upper():
-                    # If study_plan is also specified, must match both
-                    if study_plan is None or req.pla.upper() == study_plan.upper():
-                        type_match = True
-                        break
-            if not type_match:
-                continue
 
         if credits_min is not None and course.credits < credits_min:
             continue
         if credits_max is not None and course.credits > credits_max:
             continue
         results.append(
-            {
-                "id": course.id,
-                "name": course.nom,
-                "credits": course.credits,
-                "semester": course.semestre,
-                "semesters_offered": course.quadrimestres,
-                "study_plans": course.plans,
-                "syllabus_url": course.guia_docent_url_publica,
-            }
+            CourseHit(
+                id=course.id,
+                name=course.nom,
+                credits=course.credits,
+                semester=course.semestre,
+                semesters_offered=course.quadrimestres,
+                study_plans=course.plans,
+                syllabus_url=course.guia_docent_url_publica,
+            )
         )
 
     summary = f"Found {len(results)} course(s)"
@@ -95,7 +143,8 @@ def get_course_details(course_code: str) -> str:
         JSON string with full course details
     """
     client = get_fib_client()
-    course = client.get_course(course_code.upper())
+    code = course_code.upper()
+    course = cached(f"course:{code}", COLLECTION_CACHE_TTL, lambda: client.get_course(code))
 
     result = {
         "id": course.id,
@@ -2,11 +2,81 @@
 Exam schedule tools for FIB API.
 """
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Literal
 
+import numpy as np
+
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors
+
+
+@dataclass(slots=True)
+class ExamHit:
+    """One search_exams result row; orjson serializes dataclasses natively."""
+
+    course: str
+    date: str
+    start_time: str
+    end_time: str
+    classroom: str
+    type: str
+    study_plan: str
+    academic_year: str
+    semester: str
+    comments: str | None
+
+
+def _load_exams() -> list:
+    """Cache loader for the exam schedule, pre-sorted by start time (shared with warmup)."""
+    return sorted(get_fib_client().get_exams(), key=lambda exam: exam.inici)
+
+
+# Rebuilt only when the cached exam list is replaced (id-keyed, single entry).
+_table_cache: dict[int, tuple[object, "_ExamTable"]] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class _ExamTable:
+    """Columnar (structure-of-arrays) view of the exam list for vectorized filtering."""
+
+    assig: np.ndarray
+    inici: np.ndarray
+    fi: np.ndarray
+    quatr: np.ndarray
+    curs: np.ndarray
+    tipus: np.ndarray
+    pla: np.ndarray
+    # Display strings rendered once per fetch; strftime per row per query adds up.
+    date_str: list[str]
+    start_str: list[str]
+    end_str: list[str]
+    year_str: list[str]
+
+
+def _exam_table(exams: list) -> _ExamTable:
+    """Build (or reuse) the columnar view of the cached exam list."""
+    entry = _table_cache.get(id(exams))
+    if entry is not None and entry[0] is exams:
+        return entry[1]
+
+    table = _ExamTable(
+        assig=np.array([exam.assig.upper() for exam in exams]),
+        inici=np.array([exam.inici for exam in exams], dtype="datetime64[s]"),
+        fi=np.array([exam.fi for exam in exams], dtype="datetime64[s]"),
+        quatr=np.array([exam.quatr for exam in exams], dtype=np.int8),
+        curs=np.array([exam.curs for exam in exams], dtype=np.int16),
+        tipus=np.array([exam.tipus for exam in exams]),
+        pla=np.array([exam.pla.upper() for exam in exams]),
+        date_str=[exam.inici.strftime("%Y-%m-%d") for exam in exams],
+        start_str=[exam.inici.strftime("%H:%M") for exam in exams],
+        end_str=[exam.fi.strftime("%H:%M") for exam in exams],
+        year_str=[f"{exam.curs}-{exam.curs + 1}" for exam in exams],
+    )
+    _table_cache.clear()
+    _table_cache[id(exams)] = (exams, table)
+    return table
 
 
 @handle_api_errors
@@ -34,51 +104,82 @@ def search_exams(
     Returns:
         JSON string with matching exams
     """
-    client = get_fib_client()
-    exams = client.get_exams()
+    return _search_exams_impl(
+        course_code=course_code,
+        start_dt=datetime.fromisoformat(start_date) if start_date else None,
+        end_dt=datetime.fromisoformat(end_date) if end_date else None,
+        semester_int=int(semester) if semester else None,
+        year=year,
+        exam_type=exam_type,
+        study_plan=study_plan,
+    )
 
-    start_dt = datetime.fromisoformat(start_date) if start_date else None
-    end_dt = datetime.fromisoformat(end_date) if end_date else None
-    semester_int = int(semester) if semester else None
 
-    results = []
-    for exam in exams:
-        if course_code and exam.assig.upper() != course_code.upper():
-            continue
-        if start_dt and exam.inici < start_dt:
-            continue
-        if end_dt and exam.fi > end_dt:
-            continue
-        if semester_int is not None and exam.quatr != semester_int:
-            continue
-        if year is not None and exam.curs != year:
-            continue
-        if exam_type and exam.tipus != exam_type:
-            continue
-        if study_plan and exam.pla.upper() != study_plan.upper():
-            continue
+def _search_exams_impl(
+    course_code: str | None = None,
+    start_dt: datetime | None = None,
+    end_dt: datetime | None = None,
+    semester_int: int | None = None,
+    year: int | None = None,
+    exam_type: str | None = None,
+    study_plan: str | None = None,
+) -> str:
+    """Shared exam filter working directly on datetimes (no string round-trips)."""
+    exams = cached("exams", COLLECTION_CACHE_TTL, _load_exams)
+
+    summary_suffix = f" for course {course_code}" if course_code else ""
+    if not exams:
+        return format_tool_response([], f"Found 0 exam(s){summary_suffix}")
+
+    # The list is sorted by inici, so the date bounds cut a contiguous window up front:
+    # nothing before lo starts in range, nothing from hi on can end in range (fi >= inici).
+    table = _exam_table(exams)
+    lo = int(np.searchsorted(table.inici, np.datetime64(start_dt, "s"), side="left")) if start_dt else 0
+    hi = int(np.searchsorted(table.inici, np.datetime64(end_dt, "s"), side="right")) if end_dt else len(exams)
+
+    # The remaining filters are equality/range tests over the window, so the scan
+    # collapses to mask intersections; the first mask doubles as the accumulator.
+    conditions = []
+    if course_code:
+        conditions.append(table.assig[lo:hi] == course_code.upper())
+    if end_dt:
+        conditions.append(table.fi[lo:hi] <= np.datetime64(end_dt, "s"))
+    if semester_int is not None:
+        conditions.append(table.quatr[lo:hi] == semester_int)
+    if year is not None:
+        conditions.append(table.curs[lo:hi] == year)
+    if exam_type:
+        conditions.append(table.tipus[lo:hi] == exam_type)
+    if study_plan:
+        conditions.append(table.pla[lo:hi] == study_plan.upper())
+
+    if conditions:
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask &= condition
+        rows = np.flatnonzero(mask) + lo
+    else:
+        rows = range(lo, hi)
 
+    results = []
+    for i in rows:
+        exam = exams[i]
         results.append(
-            {
-                "course": exam.assig,
-                "date": exam.inici.strftime("%Y-%m-%d"),
-                "start_time": exam.inici.strftime("%H:%M"),
-                "end_time": exam.fi.strftime("%H:%M"),
-                "classroom": exam.aules,
-                "type": "Final" if exam.is_final else "Partial" if exam.is_partial else exam.tipus,
-                "study_plan": exam.pla,
-                "academic_year": f"{exam.curs}-{exam.curs + 1}",
-                "semester": f"Q{exam.quatr}",
-                "comments": exam.comentaris if exam.comentaris else None,
-            }
+            ExamHit(
+                course=exam.assig,
+                date=table.date_str[i],
+                start_time=table.start_str[i],
+                end_time=table.end_str[i],
+                classroom=exam.aules,
+                type="Final" if exam.is_final else "Partial" if exam.is_partial else exam.tipus,
+                study_plan=exam.pla,
+                academic_year=table.year_str[i],
+                semester=f"Q{exam.quatr}",
+                comments=exam.comentaris if exam.comentaris else None,
+            )
         )
 
-    results.sort(key=lambda x: (x["date"], x["start_time"]))
-
-    summary = f"Found {len(results)} exam(s)"
-    if course_code:
-        summary += f" for course {course_code}"
-    return format_tool_response(results, summary)
+    return format_tool_response(results, f"Found {len(results)} exam(s){summary_suffix}")
 
 
 @handle_api_errors
@@ -94,12 +195,10 @@ def get_upcoming_exams(days_ahead: int = 30, study_plan: str | None = None) -> s
         JSON string with upcoming exams
     """
     now = datetime.now()
-    start_date = now.strftime("%Y-%m-%d")
-    end_dt = datetime(now.year, now.month, now.day)
-    end_dt = end_dt.replace(day=min(now.day + days_ahead, 28))
+    start_dt = datetime(now.year, now.month, now.day)
 
-    return search_exams(
-        start_date=start_date,
-        end_date=end_dt.strftime("%Y-%m-%d"),
+    return _search_exams_impl(
+        start_dt=start_dt,
+        end_dt=start_dt + timedelta(days=days_ahead),
         study_plan=study_plan,
     )
@@ -5,7 +5,12 @@ News and announcements tools for FIB API.
 from datetime import datetime
 
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors
+
+
+def _load_news() -> list:
+    """Cache loader for news, newest first so the limit can short-circuit (shared with warmup)."""
+    return sorted(get_fib_client().get_news(), key=lambda item: item.data_publicacio, reverse=True)
 
 
 @handle_api_errors
@@ -20,26 +25,27 @@ def get_fib_news(limit: int = 5, since_date: str | None = None) -> str:
     Returns:
         JSON string with news items
     """
-    client = get_fib_client()
-    news_items = client.get_news()
+    news_items = cached("news", COLLECTION_CACHE_TTL, _load_news)
 
     since_dt = datetime.fromisoformat(since_date) if since_date else None
 
     results = []
     for item in news_items:
+        # >= (not ==) so a non-positive limit returns nothing, as the slice it replaced did.
+        if len(results) >= limit:
+            break
         if since_dt and item.data_publicacio < since_dt:
             continue
 
+        # plain_description strips HTML on each access; render it once per kept item.
+        description = item.plain_description
         results.append(
             {
                 "title": item.titol,
                 "date": item.data_publicacio.strftime("%Y-%m-%d"),
-                "summary": item.plain_description[:300] + "..." if len(item.plain_description) > 300 else item.plain_description,
+                "summary": description[:300] + "..." if len(description) > 300 else description,
                 "link": item.link,
             }
         )
 
-    results.sort(key=lambda x: x["date"], reverse=True)
-    results = results[:limit]
-
     return format_tool_response(results, f"Latest {len(results)} news item(s) from FIB")
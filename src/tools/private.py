@@ -4,17 +4,97 @@ Private/authenticated tools for FIB API.
 These tools access user-specific data and require OAuth authentication.
 """
 
+import asyncio
+from dataclasses import dataclass
+from itertools import islice
+from operator import attrgetter
 from typing import Literal
 
-from src.api import FIBOAuthRequiredError, get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors, matches_query
+from src.api import get_fib_client
+from src.tools.base import _cache, cached, format_tool_response, handle_api_errors, normalize_string
 
+# Profile data is effectively static for a session; enrollment and notices move faster.
+PROFILE_CACHE_TTL = 900.0
+PRIVATE_CACHE_TTL = 60.0
 
-def _check_auth() -> str | None:
-    """Check if OAuth is configured and authenticated. Returns error message if not."""
+
+# Keys carry the token hash (mirroring FIBAPIClient._cached) so cached personal
+# data never crosses users when someone re-authenticates within a TTL window.
+_PRIVATE_CACHE_PREFIXES = ("my_profile:", "my_courses:", "my_classes:", "my_notices:")
+
+
+def invalidate_private_cache() -> None:
+    """Drop cached personal data; FIBOAuthClient.logout() calls this so nothing personal outlives the session."""
+    for key in [key for key in _cache if key.startswith(_PRIVATE_CACHE_PREFIXES)]:
+        _cache.pop(key, None)
+
+
+async def warmup_private() -> None:
+    """Prefetch the personal collections concurrently so back-to-back my-data tool calls hit a warm cache."""
     client = get_fib_client()
     if not client.is_authenticated:
-        return "Authentication required. You need to log in with your FIB account to access personal data like your courses, schedule, and notices."
+        return
+    token = client._token_key()
+    await asyncio.gather(
+        asyncio.to_thread(cached, f"my_courses:{token}", PRIVATE_CACHE_TTL, client.get_my_courses),
+        asyncio.to_thread(cached, f"my_classes:{token}", PRIVATE_CACHE_TTL, client.get_my_classes),
+        asyncio.to_thread(cached, f"my_notices:{token}", PRIVATE_CACHE_TTL, client.get_my_notices),
+        return_exceptions=True,
+    )
+
+
+_DAY_MAP: dict[str, int] = {
+    "Monday": 1,
+    "Tuesday": 2,
+    "Wednesday": 3,
+    "Thursday": 4,
+    "Friday": 5,
+    "Saturday": 6,
+    "Sunday": 7,
+}
+
+
+# Auth-failure payloads never vary, so they are serialized once at import.
+_AUTH_REQUIRED_RESPONSE = format_tool_response(
+    {
+        "error": "Authentication required",
+        "message": (
+            "Authentication required. You need to log in with your FIB account to access personal data like your courses, schedule, and notices."
+        ),
+    }
+)
+
+
+@dataclass(slots=True)
+class ClassHit:
+    """One get_my_schedule result row; orjson serializes dataclasses natively."""
+
+    course: str
+    course_name: str
+    day: str
+    start_time: str
+    end_time: str
+    type: str
+    classroom: str
+    group: str
+
+
+@dataclass(slots=True)
+class NoticeHit:
+    """One get_my_notices result row."""
+
+    id: int
+    title: str
+    course: str
+    content: str
+    date: str
+    has_attachments: bool
+
+
+def _check_auth(client) -> str | None:
+    """Return the canned auth-required response if OAuth is not authenticated."""
+    if not client.is_authenticated:
+        return _AUTH_REQUIRED_RESPONSE
     return None
 
 
@@ -26,30 +106,22 @@ def get_my_profile() -> str:
     Returns:
         JSON string with user profile including name, email, student ID, and program
     """
-    auth_error = _check_auth()
+    client = get_fib_client()
+    auth_error = _check_auth(client)
     if auth_error:
-        return format_tool_response({"error": "Authentication required", "message": auth_error})
+        return auth_error
 
-    client = get_fib_client()
-    try:
-        profile = client.get_my_profile()
-        result = {
-            "username": profile.username,
-            "full_name": profile.full_name,
-            "email": profile.email,
-            "type": profile.tipus,
-            "study_plans": profile.plans_estudi,
-            "is_student": profile.is_student,
-            "is_professor": profile.is_professor,
-        }
-        return format_tool_response(result)
-    except FIBOAuthRequiredError:
-        return format_tool_response(
-            {
-                "error": "Authentication required",
-                "message": "Please log in with your FIB account to access your profile.",
-            }
-        )
+    profile = cached(f"my_profile:{client._token_key()}", PROFILE_CACHE_TTL, client.get_my_profile)
+    result = {
+        "username": profile.username,
+        "full_name": profile.full_name,
+        "email": profile.email,
+        "type": profile.tipus,
+        "study_plans": profile.plans_estudi,
+        "is_student": profile.is_student,
+        "is_professor": profile.is_professor,
+    }
+    return format_tool_response(result)
 
 
 @handle_api_errors
@@ -69,50 +141,55 @@ def get_my_courses(
     Returns:
         JSON string with enrolled courses and optional grade information
     """
-    auth_error = _check_auth()
-    if auth_error:
-        return format_tool_response({"error": "Authentication required", "message": auth_error})
-
     client = get_fib_client()
-    try:
-        courses = client.get_my_courses()
-
-        results = []
-        total_credits = 0.0
-
-        for course in courses:
-            if semester and course.quadrimestre.upper() != semester.upper():
-                continue
-            if passed_only and not course.is_passed:
-                continue
-
-            course_data = {
+    auth_error = _check_auth(client)
+    if auth_error:
+        return auth_error
+
+    courses = cached(f"my_courses:{client._token_key()}", PRIVATE_CACHE_TTL, client.get_my_courses)
+
+    semester_upper = semester.upper() if semester else None
+    # Common no-filter call reuses the cached list without a predicate pass.
+    if semester_upper is None and not passed_only:
+        filtered = courses
+    else:
+        filtered = [
+            course
+            for course in courses
+            if (not semester_upper or course.quadrimestre.upper() == semester_upper) and (not passed_only or course.is_passed)
+        ]
+    total_credits = sum(course.credits for course in filtered)
+    # Branch once on the row shape instead of unpacking a conditional dict per row.
+    if with_grades:
+        results = [
+            {
                 "id": course.id,
                 "name": course.nom,
                 "credits": course.credits,
                 "semester": course.quadrimestre,
                 "group": course.grup,
+                "grade": course.nota,
+                "qualification": course.qualificacio,
+                "passed": course.is_passed,
             }
-
-            if with_grades:
-                course_data["grade"] = course.nota
-                course_data["qualification"] = course.qualificacio
-                course_data["passed"] = course.is_passed
-
-            results.append(course_data)
-            total_credits += course.credits
-
-        summary = f"Found {len(results)} enrolled course(s), {total_credits} total credits"
-        if semester:
-            summary += f" in {semester}"
-        return format_tool_response(results, summary)
-    except FIBOAuthRequiredError:
-        return format_tool_response(
+            for course in filtered
+        ]
+    else:
+        results = [
             {
-                "error": "Authentication required",
-                "message": "Please log in with your FIB account to access your courses.",
+                "id": course.id,
+                "name": course.nom,
+                "credits": course.credits,
+                "semester": course.quadrimestre,
+                "group": course.grup,
             }
-        )
+            for course in filtered
+        ]
+
+    summary = f"Found {len(results)} enrolled course(s), {total_credits} total credits"
+    if semester:
+        summary += f" in {semester}"
+    return format_tool_response(results, summary)
 
 
 @handle_api_errors
@@ -130,59 +207,45 @@ def get_my_schedule(
     Returns:
         JSON string with class schedule including times, locations, and class types
     """
-    auth_error = _check_auth()
-    if auth_error:
-        return format_tool_response({"error": "Authentication required", "message": auth_error})
-
     client = get_fib_client()
-    try:
-        classes = client.get_my_classes()
-
-        day_map = {
-            "Monday": 1,
-            "Tuesday": 2,
-            "Wednesday": 3,
-            "Thursday": 4,
-            "Friday": 5,
-            "Saturday": 6,
-            "Sunday": 7,
-        }
-
-        results = []
-        for cls in classes:
-            if day and cls.dia_setmana != day_map.get(day, 0):
-                continue
-            if course_code and not matches_query(cls.codi_assig, course_code):
-                continue
-
-            results.append(
-                {
-                    "course": cls.codi_assig,
-                    "course_name": cls.nom_assig,
-                    "day": cls.day_name,
-                    "start_time": cls.inici,
-                    "end_time": cls.fi,
-                    "type": cls.class_type_name,
-                    "classroom": cls.aules,
-                    "group": cls.grup,
-                }
-            )
-
-        results.sort(key=lambda x: (day_map.get(x["day"], 0), x["start_time"]))
-
-        summary = f"Found {len(results)} class(es)"
-        if day:
-            summary += f" on {day}"
-        if course_code:
-            summary += f" for {course_code}"
-        return format_tool_response(results, summary)
-    except FIBOAuthRequiredError:
-        return format_tool_response(
-            {
-                "error": "Authentication required",
-                "message": "Please log in with your FIB account to access your schedule.",
-            }
+    auth_error = _check_auth(client)
+    if auth_error:
+        return auth_error
+
+    classes = cached(f"my_classes:{client._token_key()}", PRIVATE_CACHE_TTL, client.get_my_classes)
+
+    # Sorting on the model attributes before the dict build lets attrgetter
+    # (C-level) replace the old per-row lambda over rebuilt day numbers.
+    day_num = _DAY_MAP.get(day, 0) if day else None
+    course_norm = normalize_string(course_code) if course_code else None
+    filtered = sorted(
+        (
+            cls
+            for cls in classes
+            if (day_num is None or cls.dia_setmana == day_num) and (course_norm is None or course_norm in cls.codi_assig.lower())
+        ),
+        key=attrgetter("dia_setmana", "inici"),
+    )
+    results = [
+        ClassHit(
+            course=cls.codi_assig,
+            course_name=cls.nom_assig,
+            day=cls.day_name,
+            start_time=cls.inici,
+            end_time=cls.fi,
+            type=cls.class_type_name,
+            classroom=cls.aules,
+            group=cls.grup,
         )
+        for cls in filtered
+    ]
+
+    summary = f"Found {len(results)} class(es)"
+    if day:
+        summary += f" on {day}"
+    if course_code:
+        summary += f" for {course_code}"
+    return format_tool_response(results, summary)
 
 
 @handle_api_errors
@@ -200,43 +263,32 @@ def get_my_notices(
     Returns:
         JSON string with notices including title, course, content, and date
     """
-    auth_error = _check_auth()
-    if auth_error:
-        return format_tool_response({"error": "Authentication required", "message": auth_error})
-
     client = get_fib_client()
-    try:
-        notices = client.get_my_notices()
-
-        results = []
-        for notice in notices:
-            if course_code and not matches_query(notice.codi_assig, course_code):
-                continue
-
-            results.append(
-                {
-                    "id": notice.id,
-                    "title": notice.titol,
-                    "course": notice.codi_assig,
-                    "content": notice.plain_text[:500] + "..." if len(notice.plain_text) > 500 else notice.plain_text,
-                    "date": notice.data_insercio.isoformat(),
-                    "has_attachments": len(notice.adjunts) > 0,
-                }
-            )
-
-            if len(results) >= limit:
-                break
-
-        results.sort(key=lambda x: x["date"], reverse=True)
-
-        summary = f"Found {len(results)} notice(s)"
-        if course_code:
-            summary += f" for {course_code}"
-        return format_tool_response(results, summary)
-    except FIBOAuthRequiredError:
-        return format_tool_response(
-            {
-                "error": "Authentication required",
-                "message": "Please log in with your FIB account to access your notices.",
-            }
+    auth_error = _check_auth(client)
+    if auth_error:
+        return auth_error
+
+    notices = cached(f"my_notices:{client._token_key()}", PRIVATE_CACHE_TTL, client.get_my_notices)
+
+    # Sort newest first before cutting: the old break-at-limit kept an
+    # arbitrary first N in API order and only sorted those afterwards.
+    newest = sorted(notices, key=attrgetter("data_insercio"), reverse=True)
+    course_norm = normalize_string(course_code) if course_code else None
+    filtered = (notice for notice in newest if course_norm is None or course_norm in notice.codi_assig.lower())
+    results = [
+        NoticeHit(
+            id=notice.id,
+            title=notice.titol,
+            course=notice.codi_assig,
+            # plain_text strips HTML on each access; the walrus renders it once per notice.
+            content=text[:500] + "..." if len(text := notice.plain_text) > 500 else text,
+            date=notice.data_insercio.isoformat(),
+            has_attachments=len(notice.adjunts) > 0,
         )
+        for notice in islice(filtered, limit)
+    ]
+
+    summary = f"Found {len(results)} notice(s)"
+    if course_code:
+        summary += f" for {course_code}"
+    return format_tool_response(results, summary)
@@ -2,8 +2,57 @@
 Professor/faculty directory tools for FIB API.
 """
 
+from dataclasses import dataclass
+
 from src.api import get_fib_client
-from src.tools.base import format_tool_response, handle_api_errors, matches_query
+from src.tools.base import COLLECTION_CACHE_TTL, cached, format_tool_response, handle_api_errors, matches_query
+
+# Rebuilt only when the cached professor list is replaced (id-keyed, single entry).
+_index_cache: dict[int, tuple[object, dict]] = {}
+
+
+def _professor_index(professors: list) -> dict:
+    """Uppercased course tuples plus a course -> professor-rows inverted index, built once per cached fetch."""
+    entry = _index_cache.get(id(professors))
+    if entry is not None and entry[0] is professors:
+        return entry[1]
+
+    assignatures_upper = [tuple(course.upper() for course in prof.assignatures) for prof in professors]
+    by_course: dict[str, list[int]] = {}
+    for i, courses in enumerate(assignatures_upper):
+        for code in courses:
+            by_course.setdefault(code, []).append(i)
+
+    index = {"assignatures_upper": assignatures_upper, "by_course": by_course}
+    _index_cache.clear()
+    _index_cache[id(professors)] = (professors, index)
+    return index
+
+
+@dataclass(slots=True)
+class ProfessorHit:
+    """One professor result row; orjson serializes dataclasses natively."""
+
+    name: str
+    email: str
+    department: str
+    courses: list[str]
+    specializations: list[str] | None
+    research_profile: str | None
+    teaching_profile: str | None
+
+
+def _professor_row(prof) -> ProfessorHit:
+    """Shape one professor into the tool response row."""
+    return ProfessorHit(
+        name=prof.full_name,
+        email=prof.email,
+        department=prof.departament,
+        courses=prof.assignatures,
+        specializations=prof.especialitats if prof.especialitats else None,
+        research_profile=prof.futur_url if prof.futur_url else None,
+        teaching_profile=prof.apren_url if prof.apren_url else None,
+    )
 
 
 @handle_api_errors
@@ -24,30 +73,23 @@ def search_professors(
         JSON string with matching professors
     """
     client = get_fib_client()
-    professors = client.get_professors()
-
-    results = []
-    for prof in professors:
-        if name and not (matches_query(prof.nom, name) or matches_query(prof.cognoms, name)):
-            continue
-        if course_code:
-            course_upper = course_code.upper()
-            if not any(course_upper in c.upper() for c in prof.assignatures):
-                continue
-        if department and prof.departament.upper() != department.upper():
-            continue
-
-        results.append(
-            {
-                "name": prof.full_name,
-                "email": prof.email,
-                "department": prof.departament,
-                "courses": prof.assignatures,
-                "specializations": prof.especialitats if prof.especialitats else None,
-                "research_profile": prof.futur_url if prof.futur_url else None,
-                "teaching_profile": prof.apren_url if prof.apren_url else None,
-            }
-        )
+    professors = cached("professors", COLLECTION_CACHE_TTL, client.get_professors)
+
+    course_upper = course_code.upper() if course_code else None
+    department_upper = department.upper() if department else None
+
+    # Common no-filter listing skips the per-professor predicate entirely.
+    if name is None and course_upper is None and department_upper is None:
+        results = [_professor_row(prof) for prof in professors]
+    else:
+        assignatures_upper = _professor_index(professors)["assignatures_upper"] if course_upper else None
+        results = [
+            _professor_row(prof)
+            for i, prof in enumerate(professors)
+            if (not name or matches_query(prof.nom, name) or matches_query(prof.cognoms, name))
+            and (not course_upper or any(course_upper in course for course in assignatures_upper[i]))
+            and (not department_upper or prof.departament.upper() == department_upper)
+        ]
 
     summary = f"Found {len(results)} professor(s)"
     if name:
@@ -68,4 +110,10 @@ def get_course_professors(course_code: str) -> str:
     Returns:
         JSON string with professors teaching this course
     """
-    return search_professors(course_code=course_code)
+    client = get_fib_client()
+    professors = cached("professors", COLLECTION_CACHE_TTL, client.get_professors)
+
+    rows = _professor_index(professors)["by_course"].get(course_code.upper(), [])
+    results = [_professor_row(professors[i]) for i in rows]
+
+    return format_tool_response(results, f"Found {len(results)} professor(s) teaching {course_code}")